@@ -0,0 +1,169 @@
+#runs headless level simulations for every waves and difficulty option in parallel
+#and writes the outcome of each run and a summary per combination to a CSV or JSON report,
+#every run spends its credits on towers placed by a seeded strategy, at the start and once every simulated second,
+#CSV reports put the summary into a second file next to the runs, i.e. sweep_summary.csv
+#run from the repository root with: python balance_sweep.py --seeds 16 --output sweep.csv
+#imports
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import csv
+import json
+import time
+import argparse
+import itertools
+import multiprocessing
+from src.level import Level
+from src.waveschedule import WaveSchedule
+from src.towerstore import TowerStore
+
+#globals
+options_path = os.path.join("settings", "OPTIONS_SETTINGS.json")
+report_fields = ["waves", "difficulty", "seed", "grid_width", "grid_height", "ticks", "simulated_seconds",
+                 "towers", "lives_lost", "credits", "waves_reached", "won", "ticks_per_second"]
+summary_fields = ["waves", "difficulty", "runs", "win_rate", "mean_lives_lost", "mean_credits", "mean_ticks", "mean_ticks_per_second"]
+
+#loads the waves and difficulty options that the options menu offers
+def load_options(path):
+    with open(path, "r") as options_file:
+        options = json.load(options_file)
+    return options["waves"], options["difficulty"]
+
+#cells on or next to the current paths of the enemies from every spawn cell, towers there can reach the enemies
+def get_path_cells(level):
+    flow_field = level.get_flow_field()
+    width, height = level.get_store().get_grid_size()
+    path_cells = set()
+    for spawn_cell in level.get_spawn_cells():
+        path_cells.update(flow_field.get_path(spawn_cell))
+    cells = set()
+    for x, y in path_cells:
+        for nx, ny in ((x, y), (x+1, y), (x-1, y), (x, y+1), (x, y-1)):
+            #the spawn and goal columns stay free
+            if 0 < nx < width - 1 and 0 <= ny < height and not level.is_blocked((nx, ny)):
+                cells.add((nx, ny))
+    return sorted(cells)
+
+#spends the credits of the level on towers of random affordable shapes on or next to the paths,
+#all choices come from the level's seeded generator, so every seed builds a different defence
+def place_towers(level):
+    random = level.get_random()
+    placed = 0
+    while True:
+        shapes = [shape for shape in TowerStore.shapes if TowerStore.get_cost(shape) <= level.get_credits()]
+        if not shapes:
+            break
+        shape = random.choice(shapes)
+        cells = get_path_cells(level)
+        random.shuffle(cells)
+        if not any(level.place_tower(cell, shape) for cell in cells):
+            break
+        placed += 1
+    return placed
+
+#simulates a single headless level, this runs inside of a worker process
+def run_simulation(job):
+    waves, difficulty, seed, max_ticks, tick_rate = job
+    level = Level(waves=waves, difficulty=difficulty, headless=True, seed=seed, wave_schedule=WaveSchedule(difficulty))
+    #the credits earned from defeated enemies are spent once every simulated second
+    towers = 0
+    ticks = 0
+    start_time = time.perf_counter()
+    while ticks < max_ticks and not level.is_over():
+        towers += place_towers(level)
+        ticks += level.simulate(min(tick_rate, max_ticks - ticks), 1000 / tick_rate)
+    run_time = time.perf_counter() - start_time
+    grid_width, grid_height = level.get_store().get_grid_size()
+    return {
+        "waves" : waves,
+        "difficulty" : difficulty,
+        "seed" : seed,
+        "grid_width" : grid_width,
+        "grid_height" : grid_height,
+        "ticks" : ticks,
+        "simulated_seconds" : round(level.get_elapsed_time() / 1000, 3),
+        "towers" : towers,
+        "lives_lost" : Level.starting_lives - level.get_lives(),
+        "credits" : level.get_credits(),
+        "waves_reached" : min(level.get_wave(), waves),
+        "won" : level.is_won(),
+        "ticks_per_second" : round(ticks / run_time) if run_time > 0 else 0
+    }
+
+#averages the runs of every waves and difficulty combination
+def summarize(runs):
+    summary = []
+    for (waves, difficulty), group in itertools.groupby(runs, key=lambda run: (run["waves"], run["difficulty"])):
+        group = list(group)
+        count = len(group)
+        summary.append({
+            "waves" : waves,
+            "difficulty" : difficulty,
+            "runs" : count,
+            "win_rate" : round(sum(run["won"] for run in group) / count, 3),
+            "mean_lives_lost" : round(sum(run["lives_lost"] for run in group) / count, 3),
+            "mean_credits" : round(sum(run["credits"] for run in group) / count, 3),
+            "mean_ticks" : round(sum(run["ticks"] for run in group) / count, 1),
+            "mean_ticks_per_second" : round(sum(run["ticks_per_second"] for run in group) / count)
+        })
+    return summary
+
+#the summary of a CSV report is written to a second file, i.e. sweep.csv and sweep_summary.csv
+def get_summary_path(path):
+    base, extension = os.path.splitext(path)
+    return f"{base}_summary{extension or '.csv'}"
+
+def write_csv(path, fields, rows):
+    with open(path, "w", newline="") as report_file:
+        writer = csv.DictWriter(report_file, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+#the report format is chosen by the file extension of the output path
+def write_report(path, runs, summary):
+    if path.endswith(".json"):
+        with open(path, "w") as report_file:
+            json.dump({"runs" : runs, "summary" : summary}, report_file, indent=4)
+    else:
+        write_csv(path, report_fields, runs)
+        write_csv(get_summary_path(path), summary_fields, summary)
+
+def print_summary(summary):
+    print(" ".join(summary_fields))
+    for row in summary:
+        print(" ".join(f"{row[field]:>{len(field)}}" for field in summary_fields))
+
+#argparse type for counts that have to be at least 1
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not at least 1")
+    return number
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Runs headless level simulations for every waves and difficulty option.")
+    parser.add_argument("--seeds", type=positive_int, default=8, help="number of seeded runs per waves and difficulty combination")
+    parser.add_argument("--first-seed", type=int, default=0, help="seed of the first run of every combination")
+    parser.add_argument("--max-ticks", type=positive_int, default=60*60*30, help="maximum number of ticks a single run is simulated for")
+    parser.add_argument("--tick-rate", type=positive_int, default=60, help="simulation ticks per simulated second")
+    parser.add_argument("--processes", type=positive_int, default=os.cpu_count(), help="number of worker processes, defaults to all cores")
+    parser.add_argument("--output", default="balance_sweep.csv", help="report path, a .json extension writes JSON instead of CSV, CSV summaries go to <name>_summary.csv")
+    return parser.parse_args()
+
+def main():
+    arguments = parse_arguments()
+    waves_options, difficulty_options = load_options(options_path)
+    jobs = [(waves, difficulty, seed, arguments.max_ticks, arguments.tick_rate)
+            for waves in waves_options
+            for difficulty in difficulty_options
+            for seed in range(arguments.first_seed, arguments.first_seed + arguments.seeds)]
+    start_time = time.perf_counter()
+    with multiprocessing.Pool(arguments.processes) as pool:
+        runs = pool.map(run_simulation, jobs, chunksize=max(1, len(jobs) // (arguments.processes * 4)))
+    sweep_time = time.perf_counter() - start_time
+    summary = summarize(runs)
+    write_report(arguments.output, runs, summary)
+    print_summary(summary)
+    print(f"{len(runs)} runs on {arguments.processes} processes in {sweep_time:.2f}s, report written to {arguments.output}")
+
+if __name__ == "__main__":
+    main()
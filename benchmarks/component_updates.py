@@ -0,0 +1,50 @@
+# micro-benchmark for the cost of a single component update,
+# compares validated calls against trusted calls that skip validation
+# panel moves also measure the fan-out of a position update to all 16 descendants of a panel of four buttons
+# run from the repository root with: python -m benchmarks.component_updates
+import os
+import timeit
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+from src.alignment import Alignment
+from src.box import Box
+from src.button import Button
+
+#globals
+repetitions = 5
+iterations = 2000
+
+#builds a panel similar to an options row of the menu interface
+def create_panel():
+    panel = Box(name="Benchmark_Panel", position=(0, 0), size=(640, 72))
+    for column in range(4):
+        panel.add_child(Button.quick_create(name=f"Benchmark_Button_{column}", text=str(column), position=(column * 160, 0), 
+                                            h_align=Alignment.START, v_align=Alignment.START, size=(150, 72)))
+    return panel
+
+#times the given update and returns the best cost per update in microseconds
+def time_update(update):
+    best_time = min(timeit.repeat(update, number=iterations, repeat=repetitions))
+    return best_time / iterations * 1000000
+
+def main():
+    pygame.init()
+    panel = create_panel()
+    box = Box(name="Benchmark_Box", position=(0, 0), size=(64, 64))
+    results = {
+        "box move (validated)" : time_update(lambda: box.move((1, 1), update_component=False)),
+        "box move (trusted)" : time_update(lambda: box.move((1, 1), update_component=False, trusted=True)),
+        "panel move (validated)" : time_update(lambda: panel.move((1, 1), update_component=False)),
+        "panel move (trusted)" : time_update(lambda: panel.move((1, 1), update_component=False, trusted=True)),
+        "panel update_color (validated)" : time_update(lambda: panel.update_color((10, 20, 30), update_component=False)),
+        "panel update_color (trusted)" : time_update(lambda: panel.update_color((10, 20, 30), update_component=False, trusted=True)),
+        "panel update_size (validated)" : time_update(lambda: panel.update_size((640, 72), update_component=False)),
+        "panel update_size (trusted)" : time_update(lambda: panel.update_size((640, 72), update_component=False, trusted=True))
+    }
+    for name, cost in results.items():
+        print(f"{name:<34}{cost:8.2f} us/update")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# benchmark for the enemies within range queries of all towers in one tick,
+# compares the spatial hash against brute force over every tower and enemy pair
+# run from the repository root with: python -m benchmarks.spatial_hash
+import timeit
+import numpy as np
+from src.spatialhash import SpatialHash
+
+#globals
+repetitions = 5
+iterations = 20
+grid_size = (64, 32)
+tower_count = 100
+enemy_count = 2000
+tower_range = 3.0
+
+#brute force with a python loop per tower and enemy, as the game would do it without any structure
+def brute_force_loops(towers, enemies):
+    range_squared = tower_range * tower_range
+    pairs = []
+    for tower_index, (tower_x, tower_y) in enumerate(towers):
+        for enemy_index, (enemy_x, enemy_y) in enumerate(enemies):
+            if (enemy_x - tower_x) ** 2 + (enemy_y - tower_y) ** 2 <= range_squared:
+                pairs.append((tower_index, enemy_index))
+    return pairs
+
+#brute force with one distance matrix of all towers and enemies
+def brute_force_matrix(towers, enemies):
+    offsets = enemies[None, :, :] - towers[:, None, :]
+    inside = np.einsum("ijk,ijk->ij", offsets, offsets) <= tower_range * tower_range
+    return np.nonzero(inside)
+
+#the hash is rebuilt as well, like it is every tick
+def spatial_hash_range(spatial_hash, towers, enemies):
+    spatial_hash.build(enemies)
+    return spatial_hash.query_range(towers, tower_range)
+
+def spatial_hash_nearest(spatial_hash, towers, enemies):
+    spatial_hash.build(enemies)
+    return spatial_hash.query_nearest(towers, tower_range)
+
+#times the given query and returns the best cost per tick in milliseconds
+def time_query(query, iterations=iterations):
+    best_time = min(timeit.repeat(query, number=iterations, repeat=repetitions))
+    return best_time / iterations * 1000
+
+def main():
+    generator = np.random.default_rng(0)
+    towers = (generator.integers(0, grid_size, size=(tower_count, 2)) + 0.5).astype(np.float32)
+    enemies = (generator.random((enemy_count, 2)) * grid_size).astype(np.float32)
+    spatial_hash = SpatialHash(grid_size)
+    #all approaches have to find the same pairs
+    expected = set(zip(*(indices.tolist() for indices in brute_force_matrix(towers, enemies))))
+    found = set(zip(*(indices.tolist() for indices in spatial_hash_range(spatial_hash, towers, enemies))))
+    if found != expected:
+        raise RuntimeError("Spatial hash and brute force found different pairs!")
+    tower_list = towers.tolist()
+    enemy_list = enemies.tolist()
+    results = {
+        "brute force (python loops)" : time_query(lambda: brute_force_loops(tower_list, enemy_list), iterations=1),
+        "brute force (distance matrix)" : time_query(lambda: brute_force_matrix(towers, enemies)),
+        "spatial hash build" : time_query(lambda: spatial_hash.build(enemies)),
+        "spatial hash build + range" : time_query(lambda: spatial_hash_range(spatial_hash, towers, enemies)),
+        "spatial hash build + nearest" : time_query(lambda: spatial_hash_nearest(spatial_hash, towers, enemies))
+    }
+    print(f"{tower_count} towers x {enemy_count} enemies on a {grid_size[0]}x{grid_size[1]} grid, range {tower_range} cells, {len(expected)} pairs")
+    for name, cost in results.items():
+        print(f"{name:<34}{cost:8.3f} ms/tick")
+
+if __name__ == "__main__":
+    main()
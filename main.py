@@ -1,4 +1,6 @@
 #imports
+import time
+import argparse
 import pygame
 from src.gamesettings import GameSettings
 from src.gamestates import GameState
@@ -14,6 +16,15 @@ from src.level import Level
 from src.grid import Grid
 from src.gridcell import GridCell
 from src.input import Input
+from src.fontcache import FontCache
+from src.textcache import TextCache
+from src.glyphatlas import GlyphAtlas
+from src.dirtyrects import DirtyRects
+from src.eventrouter import EventRouter
+from src.fixedtimestep import FixedTimestep
+from src.inputrecorder import InputRecorder, InputReplayer
+from src.frameprofiler import FrameProfiler
+from src.profileroverlay import ProfilerOverlay
 
 #globals
 game_is_running = True
@@ -25,12 +36,25 @@ screen = None
 clock = None
 level = None
 input = None
+event_router = None
+dirty_rendering = True
+simulation_tick_rate = 60
+fast_forward_speed = 2
+timestep = FixedTimestep(tick_rate=simulation_tick_rate)
+recorder = None
+replayer = None
+unthrottled = False
+level_seed = None
+profiler = FrameProfiler()
+profiler_overlay = None
+profile_path = None
 
 #initializes the game. resets everything when called again later
 def init_game():
     init_settings()
     init_interfaces()
     init_input()
+    init_events()
     change_state(GameState.MENU)
 
 #initializes input tracker
@@ -38,10 +62,37 @@ def init_input():
     global input
     input = Input()
 
+#(re)subscribes every subsystem to the event types it handles
+def init_events():
+    global event_router, input, level, interfaces
+    if not event_router:
+        event_router = EventRouter()
+    event_router.subscribe(input.get_event_types(), handle_input_event, priority=0)
+    event_router.subscribe(input.get_global_event_types(), handle_global_event, priority=1)
+    if level:
+        event_router.subscribe(level.get_event_types(), handle_level_event, priority=2)
+    event_router.subscribe(interfaces.get_event_types(), handle_interface_event, priority=3)
+
 #initializes the game's level
 def init_level():
-    global game_settings, level
-    level = Level(waves=game_settings.get_setting("waves"), difficulty=game_settings.get_setting("difficulty"))
+    global game_settings, level, level_seed
+    level = Level(waves=game_settings.get_setting("waves"), difficulty=game_settings.get_setting("difficulty"), seed=level_seed)
+    init_timestep()
+    init_events()
+
+#resets the simulation clock to normal speed
+def init_timestep():
+    global timestep
+    timestep.reset()
+    timestep.set_speed(1)
+
+#switches the simulation between normal speed and fast forward
+def toggle_fast_forward():
+    global timestep, fast_forward_speed
+    if timestep.get_speed() == 1:
+        timestep.set_speed(fast_forward_speed)
+    else:
+        timestep.set_speed(1)
 
 #initializes settings
 def init_settings():
@@ -56,14 +107,18 @@ def save_options():
     changed_flags = game_settings.apply_selection_options()
     if changed_flags["fullscreen"] or changed_flags["resolution"]:
         init_display()
+        init_profiler_overlay()
         init_interfaces()
+        init_events()
         change_state(current_state)
 
 #initialize everything related to pygame
 def init_pygame():
     global clock
     pygame.init()
+    DirtyRects.set_enabled(dirty_rendering)
     init_display()
+    init_profiler_overlay()
     clock = pygame.time.Clock()
 
 #(re)initialize the display and related variables
@@ -73,6 +128,21 @@ def init_display():
     resolution = game_settings.get_setting("resolution")
     flags = pygame.FULLSCREEN if fullscreen else 0
     screen = pygame.display.set_mode(resolution, flags)
+    DirtyRects.invalidate_all()
+
+#(re)creates the profiler overlay in the top right corner of the screen, it stays visible if it was before
+def init_profiler_overlay():
+    global screen, profiler_overlay
+    was_visible = profiler_overlay is not None and profiler_overlay.is_visible()
+    profiler_overlay = ProfilerOverlay(position=(screen.get_width() - ProfilerOverlay.width, 0))
+    if was_visible:
+        profiler_overlay.show()
+
+#shows or hides the profiler overlay, the profiler only measures frames while it is needed
+def toggle_profiler_overlay():
+    global profiler, profiler_overlay, profile_path
+    profiler_overlay.toggle()
+    profiler.set_enabled(profiler_overlay.is_visible() or profile_path is not None)
 
 #(re)set all interfaces
 def init_interfaces():
@@ -129,7 +199,7 @@ def init_interfaces():
     implement_options_functionality(menu_options_panel, "fps")
 
     # Options Panel Save Button             ("Menu_Options_Panel_Save")
-    options_panel_save = menu_options_panel.get_child("Menu_Options_Panel_Save")
+    options_panel_save = menu_interface.find("Menu_Options_Panel/Menu_Options_Panel_Save")
     options_panel_save.set_callback(
         lambda : save_options()
     )
@@ -167,8 +237,11 @@ def init_interfaces():
     gameplay_pause_button.set_callback(
         lambda: queue_state(GameState.PAUSE)
     )
-    # Fast Forward Button                   ("Fastforward_Button")    (NOT YET IMPLEMENTED)
+    # Fast Forward Button                   ("Fastforward_Button")
     gameplay_fast_forward_button = information_panel.get_child("Fastforward_Button")
+    gameplay_fast_forward_button.set_callback(
+        lambda: toggle_fast_forward()
+    )
     # Main Menu Button                      ("Main_Menu_Button")
     gameplay_main_menu_button = information_panel.get_child("Main_Menu_Button")
     gameplay_main_menu_button.set_callback(
@@ -216,6 +289,7 @@ def change_state(new_state):
     gameover = get_interface(GameState.END)
 
     #switch to new state
+    DirtyRects.invalidate_all()
     previous_state = current_state
     current_state = new_state
     if current_state == GameState.QUIT:
@@ -238,83 +312,184 @@ def change_state(new_state):
         gameplay.deactivate()
         gameover.show()
 
+#event handlers, each returns True if it consumed the event
+#updates our input tracker, never consumes events
+def handle_input_event(event):
+    global input
+    input.handle_event(event)
+    return False
+
+#global events are handled before level and interface events
+def handle_global_event(event):
+    global input, current_state
+    if input.get_key_name(event.key) == "profiler":
+        toggle_profiler_overlay()
+        return True
+    if current_state == GameState.PLAY and input.pause_pressed():
+        queue_state(GameState.PAUSE)
+        return True
+    return False
+
+def handle_level_event(event):
+    global input, level
+    if level:
+        return level.handle_event(event, input)
+    return False
+
+def handle_interface_event(event):
+    global input, interfaces
+    return interfaces.handle_event(event, input)
+
 #called during gameloop to handle events
 def handle_events():
-    global game_is_running, pending_state, input, level, interfaces, mouse_button_held, pause_keys, current_state
-    for event in pygame.event.get():
+    global game_is_running, pending_state, event_router, profiler
+    events = get_frame_events()
+    profiler.count_events(len(events))
+    for event in events:
         #check for game end first
         if event.type == pygame.QUIT:
             game_is_running = False
             return
         
-        #update our input tracker
-        input.handle_event(event)
-
-        #setup event handling variables
-        event_consumed = False
-
-        #global event first
-        if current_state == GameState.PLAY and input.pause_pressed():
-            queue_state(GameState.PAUSE)
-            event_consumed = True
-        
-        #level events
-        if level and not event_consumed:
-            event_consumed = level.handle_event(event, input)
-        
-        #interface events
-        if not event_consumed:
-            event_consumed = interfaces.handle_event(event, input)
+        #route the event to the subsystems subscribed to its type
+        event_router.dispatch(event)
         
         #resolve state changes after events are handled
         if pending_state:
             change_state(pending_state)
             pending_state = None
 
+#returns the events of the current frame, which are replaced by the recorded ones during a replay
+#only quitting is still taken from the real event queue while replaying
+def get_frame_events():
+    global recorder, replayer
+    events = pygame.event.get()
+    if replayer:
+        return [event for event in events if event.type == pygame.QUIT] + replayer.get_events()
+    if recorder:
+        recorder.record_events(events)
+    return events
+
+#waits for the next frame and returns the time the current frame took
+#a replay uses the recorded frame times instead, so the simulation runs exactly as recorded
+def next_frame_time():
+    global game_is_running, game_settings, clock, recorder, replayer, unthrottled
+    frame_time = clock.tick(0 if unthrottled else game_settings.get_setting("fps"))
+    if recorder:
+        recorder.record_frame_time(frame_time)
+    if replayer:
+        frame_time = replayer.next_frame()
+        if replayer.is_finished():
+            game_is_running = False
+    return frame_time
+
 #called during gameloop to render the game
 def render_game():
-    global screen, level, interfaces, current_state
+    global screen, level, interfaces, current_state, dirty_rendering, timestep
+
+    #only repaint regions that changed since the last frame
+    if dirty_rendering:
+        if level and current_state == GameState.PLAY:
+            level.report_dirty_regions()
+        dirty_rects = DirtyRects.flush(screen.get_rect())
+        if not dirty_rects:
+            return
+        screen.set_clip(dirty_rects[0].unionall(dirty_rects[1:]))
 
     #reset screen
     screen.fill("black")
 
     #render game grid first
     if current_state == GameState.PLAY or current_state == GameState.PAUSE or current_state == GameState.END:
-        level.render(screen)
+        level.render(screen, timestep.get_interpolation())
     
     #render interfaces on top
     interfaces.render(screen)
+
+    #the profiler overlay is drawn above everything else
+    profiler_overlay.render(screen)
     
     #finish rendering
-    pygame.display.flip()
+    if dirty_rendering:
+        screen.set_clip(None)
+        pygame.display.update(dirty_rects)
+    else:
+        pygame.display.flip()
 
 #called during gameloop to update in-game logic
-def update_game(delta_time):
-    global current_state, level
+#the level is simulated in fixed steps, as many as the elapsed frame time allows
+def update_game(frame_time):
+    global current_state, level, timestep
     if current_state == GameState.PLAY:
-        level.update(delta_time)
+        for step in range(timestep.advance(frame_time)):
+            level.update(timestep.get_step())
 
 #main program, contains the gameloop
+#recording and replaying input is optional, i.e. python main.py --record session.rec.gz
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Trivasion")
+    parser.add_argument("--record", metavar="PATH", help="records all input of the session to a file")
+    parser.add_argument("--replay", metavar="PATH", help="replays the input recorded in a file instead of reading live input")
+    parser.add_argument("--unthrottled", action="store_true", help="doesn't limit the framerate, i.e. to time replays")
+    parser.add_argument("--profile", metavar="PATH", help="profiles every frame and writes the frame timings to a file on exit")
+    return parser.parse_args()
+
+def init_profiler(arguments):
+    global profiler, profile_path
+    profile_path = arguments.profile
+    profiler.set_enabled(profile_path is not None)
+
+#a replay runs with the settings it was recorded with, so it plays out the same on every machine
+def init_recording(arguments):
+    global recorder, replayer, unthrottled, level_seed, game_settings
+    unthrottled = arguments.unthrottled
+    if arguments.replay:
+        replayer = InputReplayer(arguments.replay)
+        level_seed = replayer.get_seed()
+        if replayer.get_settings():
+            game_settings.override_settings(replayer.get_settings())
+    elif arguments.record:
+        recorder = InputRecorder(arguments.record, settings=game_settings.game_settings)
+        level_seed = recorder.get_seed()
+
 def main():
-    global game_is_running, game_settings, clock
+    global game_is_running, game_settings, clock, replayer, profiler, profiler_overlay
+    arguments = parse_arguments()
+    init_recording(arguments)
+    init_profiler(arguments)
     init_pygame()
     init_game()
 
     #game loop
+    frame_time = 0
+    start_time = time.perf_counter()
     while game_is_running:
         #events
-        handle_events()
+        profiler.run_phase("events", handle_events)
         #tick update logic
-        update_game(clock.get_time())
+        profiler.run_phase("update", update_game, frame_time)
         #draw update logic
-        render_game()
+        profiler_overlay.update(profiler)
+        profiler.run_phase("render", render_game)
         
-        #limit tickrate
-        clock.tick(game_settings.get_setting("fps"))
+        #limit framerate, the simulation tickrate is fixed
+        frame_time = next_frame_time()
+        profiler.end_frame(frame_time)
+    if replayer:
+        run_time = time.perf_counter() - start_time
+        print(f"Replayed {replayer.get_frame()} frames in {run_time:.3f}s ({run_time * 1000 / max(1, replayer.get_frame()):.3f}ms per frame)")
     quit_game()
 
 #called when game ends
 def quit_game():
+    global recorder, profiler, profile_path
+    if recorder:
+        recorder.save()
+    if profile_path:
+        profiler.dump(profile_path)
+    FontCache.clear()
+    TextCache.clear()
+    GlyphAtlas.clear()
     pygame.quit()
 
 #ensure that main program is called
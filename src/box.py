@@ -1,6 +1,8 @@
 from src.gameinterfacecomponent import GameInterfaceComponent
 from src.alignment import Alignment
 from src.label import Label
+from src.counterlabel import CounterLabel
+from src.prioritylist import PriorityList
 from src.validate import Validate
 
 class Box(GameInterfaceComponent):
@@ -40,42 +42,38 @@ class Box(GameInterfaceComponent):
             child.show()
     
     #CHILD METHODS:
+    # children are kept in priority order by a PriorityList,
+    # so adding or removing a child never re-sorts all children
     def reset_children(self):
-        self.__children = []
+        self.__children = PriorityList()
 
-    def add_child(self, child, sort=True):
+    def add_child(self, child):
         GameInterfaceComponent.validate_component(child)
-        self.__children.append(child)
-        if sort:
-            self.sort_children()
+        if self.__children.add(child):
+            child.set_parent(self)
     
     def add_children(self, children):
-        for child in children:
-            if isinstance(child, GameInterfaceComponent):
-                self.add_child(child, sort=False)
-        self.sort_children()
+        added = self.__children.add_all([child for child in children if isinstance(child, GameInterfaceComponent)])
+        for child in added:
+            child.set_parent(self)
     
-    def remove_child(self, child, sort=True):
+    def remove_child(self, child):
         GameInterfaceComponent.validate_component(child)
-        if child in self.__children:
-            self.__children.remove(child)
-        if sort:
-            self.sort_children()
+        if self.__children.remove(child):
+            child.set_parent(None)
     
     def remove_children(self, children):
-        for child in children:
-            if isinstance(child, GameInterfaceComponent):
-                self.remove_child(child, sort=False)
-        self.sort_children()
+        removed = self.__children.remove_all([child for child in children if isinstance(child, GameInterfaceComponent)])
+        for child in removed:
+            child.set_parent(None)
     
+    # only necessary if the priority of a child changed after it was added
     def sort_children(self):
-        self.__children.sort(key=lambda child: child.get_priority())
+        self.__children.sort()
 
     def get_child(self, name):
-        for child in self.__children:
-            if child.is_named(name):
-                return child
-        return None
+        Validate.name(name)
+        return self.__children.get_named(name)
     
     def get_children(self, names):
         children = []
@@ -85,6 +83,21 @@ class Box(GameInterfaceComponent):
                 children.append(child)
         return children
     
+    def on_child_renamed(self, child, previous_name):
+        self.__children.rename(child, previous_name)
+    
+    # finds a descendant by a path of names separated by slashes,
+    # i.e. "Menu_Options_Waves_Row/Menu_Options_Waves_Selected"
+    def find(self, path):
+        Validate.name(path)
+        name, _, remaining_path = path.partition("/")
+        child = self.get_child(name)
+        if child is None or not remaining_path:
+            return child
+        if not isinstance(child, Box):
+            return None
+        return child.find(remaining_path)
+    
     #GAMELOOP METHODS:
     def render(self, screen):
         super().render(screen)
@@ -93,6 +106,32 @@ class Box(GameInterfaceComponent):
             if child.is_visible():
                 child.render(screen)
     
+    def get_event_types(self):
+        event_types = set()
+        for child in self.__children:
+            event_types.update(child.get_event_types())
+        return frozenset(event_types)
+    
+    def collect_interactive(self, components):
+        for child in self.__children:
+            child.collect_interactive(components)
+    
+    def collect_descendants(self, components):
+        for child in self.__children:
+            components.append(child)
+            child.collect_descendants(components)
+    
+    def render_static(self, screen):
+        GameInterfaceComponent.render(self, screen)
+        for child in self.__children:
+            if child.is_visible():
+                child.render_static(screen)
+    
+    def render_dynamic(self, screen):
+        for child in self.__children:
+            if child.is_visible():
+                child.render_dynamic(screen)
+    
     def handle_event(self, event, input):
         # Children might be interactive
         for child in self.__children:
@@ -111,23 +150,21 @@ class Box(GameInterfaceComponent):
     # THE FOLLOWING ARE THE UPDATE METHODS - EACH CALLS UPDATE_COMPONENT AT THE END
     # EACH OF THESE METHODS INCLUDES A FLAG 'UPDATE_COMPONENT' THAT CAN BE SET TO FALSE
     # TO REDUCE REDUNDANT UPDATE_COMPONENT CALLS FOR CHILD ELEMENTS
-    def update_position(self, new_position, relative = False, update_component = True):
-        for child in self.__children:
-            child.update_position(new_position=new_position, relative=relative, update_component=False)
-        super().update_position(new_position=new_position, relative=relative, update_component=update_component)
-    
-    def move(self, movement=(0,0), update_component = True):
-        self.update_position(movement, relative=True, update_component=update_component)
+    # the new values are validated once here, children receive them as trusted values
+    def move(self, movement=(0,0), update_component = True, trusted = False):
+        self.update_position(movement, relative=True, update_component=update_component, trusted=trusted)
 
-    def update_alpha(self, alpha, propogate_children = False, update_component = True):
+    def update_alpha(self, alpha, propogate_children = False, update_component = True, trusted = False):
+        if not trusted:
+            Validate.alpha(alpha)
         if propogate_children:
             for child in self.__children:
                 if (hasattr(child, "update_alpha") and callable(getattr(child, "update_alpha"))):
                     if hasattr(child, "__children") or hasattr(child, "__styles"):
-                        child.update_alpha(alpha, propogate_children=propogate_children, update_component=False)
+                        child.update_alpha(alpha, propogate_children=propogate_children, update_component=False, trusted=True)
                     else:
-                        child.update_alpha(alpha, update_component=False)
-        super().update_alpha(alpha, update_component=update_component)
+                        child.update_alpha(alpha, update_component=False, trusted=True)
+        super().update_alpha(alpha, update_component=update_component, trusted=True)
 
     #THE FOLLOWING ARE ANY STATIC METHODS
     @staticmethod
@@ -138,13 +175,38 @@ class Box(GameInterfaceComponent):
         # modification are validated to avoid redundant checks
         Validate.name(name)
         Validate.priority(priority)
+        #create box label
+        label = Label(name=f"{name}_Label", priority=priority+1, content=text, position=position, color=text_color, font_size=text_size)
+        return Box.create_label_box(name=name, priority=priority, label=label, position=position, h_align=h_align, v_align=v_align, 
+                                    size=size, padding=padding, box_color=box_color, alpha=alpha)
+    
+    @staticmethod
+    def create_counter_box(name="Counter_Box", priority=0, prefix="", value=0, maximum=None, position=(0,0), h_align=Alignment.MIDDLE, 
+                           v_align=Alignment.MIDDLE, size=(1,1), padding=(4,2), box_color=(128,128,128), alpha=255, text_color=(255, 255, 255), text_size=36):
+        # validate parameters
+        # only parameters that aren't directly passed without
+        # modification are validated to avoid redundant checks
+        Validate.name(name)
+        Validate.priority(priority)
+        #create box counter label
+        label = CounterLabel(name=f"{name}_Label", priority=priority+1, prefix=prefix, value=value, maximum=maximum, position=position, 
+                             color=text_color, font_size=text_size)
+        return Box.create_label_box(name=name, priority=priority, label=label, position=position, h_align=h_align, v_align=v_align, 
+                                    size=size, padding=padding, box_color=box_color, alpha=alpha)
+    
+    # wraps an existing label into a box that is at least big enough to hold the label and its padding
+    @staticmethod
+    def create_label_box(name="Label_Box", priority=0, label=None, position=(0,0), h_align=Alignment.MIDDLE, v_align=Alignment.MIDDLE, 
+                         size=(1,1), padding=(4,2), box_color=(128,128,128), alpha=255):
+        # validate parameters
+        # only parameters that aren't directly passed without
+        # modification are validated to avoid redundant checks
+        Label.validate_label(label)
         Validate.alignment(h_align)
         Validate.alignment(v_align)
         Validate.size(size)
         Validate.padding(padding)
         Validate.alpha(alpha)
-        #create button label
-        label = Label(name=f"{name}_Label", priority=priority+1, content=text, position=position, color=text_color, font_size=text_size)
         label_size = label.get_size()
         #prepare sizing
         box_size = (
@@ -69,6 +69,7 @@ class Button(GameInterfaceComponent):
     def set_label(self, label):
         if label:
             Label.validate_label(label)
+            label.set_parent(self)
         self.__label = label
     
     def get_label(self):
@@ -113,6 +114,7 @@ class Button(GameInterfaceComponent):
     def set_style(self, key, style):
         Box.validate_box(style)
         self.validate_style(key)
+        style.set_parent(self)
         self.__styles[key] = style
     
     def set_styles(self, styles):
@@ -130,6 +132,31 @@ class Button(GameInterfaceComponent):
     def get_current_style(self):
         return self.get_style(self.get_state())
     
+    #EVENT TYPE METHODS:
+    def get_event_types(self):
+        return GameInterfaceComponent.pointer_event_types
+    
+    #INTERACTIVITY METHODS:
+    def is_interactive(self):
+        return True
+
+    #DESCENDANT METHODS:
+    # the styles move along with the button
+    def collect_descendants(self, components):
+        for state in self.__styles:
+            style = self.__styles[state]
+            components.append(style)
+            style.collect_descendants(components)
+
+    #STATIC LAYER METHODS:
+    # buttons change their state with the mouse, so they are never part of a cached layer
+    def is_static(self):
+        return False
+    
+    # the label and styles are drawn live together with the button itself
+    def on_child_changed(self, component):
+        pass
+    
     #GAMELOOP METHODS:
     def render(self, screen):
         style = self.get_current_style()
@@ -167,15 +194,13 @@ class Button(GameInterfaceComponent):
     # THE FOLLOWING ARE THE UPDATE METHODS - EACH CALLS UPDATE_COMPONENT AT THE END
     # EACH OF THESE METHODS INCLUDES A FLAG 'UPDATE_COMPONENT' THAT CAN BE SET TO FALSE
     # TO REDUCE REDUNDANT UPDATE_COMPONENT CALLS FOR CHILD ELEMENTS
-    def update_position(self, new_position, relative = False, update_component = True):
-        for state in self.__styles:
-            self.__styles[state].update_position(new_position=new_position, relative=relative, update_component=False)
-        super().update_position(new_position=new_position, relative=relative, update_component=update_component)
-    
-    def move(self, movement=(0,0), update_component = True):
-        self.update_position(movement, relative=True, update_component=update_component)
+    # the new values are validated once here, styles receive them as trusted values
+    def move(self, movement=(0,0), update_component = True, trusted = False):
+        self.update_position(movement, relative=True, update_component=update_component, trusted=trusted)
     
-    def update_size(self, new_size, update_component = True):
+    def update_size(self, new_size, update_component = True, trusted = False):
+        if not trusted:
+            Validate.size(new_size)
         label = self.get_label()
         if label:
             label_width, label_height = label.get_size()
@@ -191,8 +216,8 @@ class Button(GameInterfaceComponent):
             new_size = (new_button_width, new_button_height)
         
         for state in self.__styles:
-            self.__styles[state].update_size(new_size=new_size, update_component=update_component)
-        super().update_size(new_size=new_size, update_component=update_component)
+            self.__styles[state].update_size(new_size=new_size, update_component=update_component, trusted=True)
+        super().update_size(new_size=new_size, update_component=update_component, trusted=True)
     
     #THE FOLLOWING ARE ANY STATIC METHODS
     @staticmethod
@@ -0,0 +1,76 @@
+#imports
+import numpy as np
+
+# keeps the rows of a store (i.e. enemies or towers) in contiguous arrays, one array per column,
+# subclasses describe their columns and only ever reach the arrays through get_column and get_array
+# the capacity grows by doubling and removed rows are overwritten by the last rows (swap remove)
+class ColumnStore():
+    #static variables
+    columns = {}        #column name : (dtype, shape of a single row), set by every subclass
+
+    def __init__(self, capacity=64):
+        self.reset(capacity)
+
+    #VALIDATION METHOD:
+    @staticmethod
+    def validate_column_store(store):
+        if not isinstance(store, ColumnStore):
+            raise TypeError("Store must be of class ColumnStore or a subclass!")
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    #ARRAY METHODS:
+    def reset(self, capacity=64):
+        if not isinstance(capacity, int):
+            raise TypeError("Store capacity must be an integer!")
+        if capacity < 1:
+            raise ValueError("Store capacity must be at least 1!")
+        self.__count = 0
+        self.__capacity = capacity
+        self.__arrays = {name : np.zeros((capacity,) + shape, dtype=dtype) for name, (dtype, shape) in type(self).columns.items()}
+
+    def get_capacity(self):
+        return self.__capacity
+
+    def get_count(self):
+        return self.__count
+
+    # doubles the capacity until the given number of rows fits
+    def reserve(self, count):
+        capacity = self.__capacity
+        if count <= capacity:
+            return
+        while capacity < count:
+            capacity *= 2
+        for name, old_array in self.__arrays.items():
+            new_array = np.zeros((capacity,) + old_array.shape[1:], dtype=old_array.dtype)
+            new_array[:self.__count] = old_array[:self.__count]
+            self.__arrays[name] = new_array
+        self.__capacity = capacity
+
+    # the whole array of a column, including the unused rows behind the live ones
+    def get_array(self, name):
+        return self.__arrays[name]
+
+    # a view of the live rows of a column
+    def get_column(self, name):
+        return self.__arrays[name][:self.__count]
+
+    #ROW METHODS:
+    # makes room for the given number of rows at the end, returns the index of the first new row,
+    # the new rows have to be filled in through get_array
+    def add_rows(self, amount):
+        start = self.__count
+        self.reserve(start + amount)
+        self.__count = start + amount
+        return start
+
+    # removing k rows moves at most k rows, so the arrays stay contiguous
+    def remove_rows(self, mask):
+        count = self.__count
+        mask = np.asarray(mask, dtype=bool)
+        remaining_count = count - int(np.count_nonzero(mask))
+        holes = np.flatnonzero(mask[:remaining_count])
+        fillers = remaining_count + np.flatnonzero(~mask[remaining_count:])
+        for array in self.__arrays.values():
+            array[holes] = array[fillers]
+        self.__count = remaining_count
@@ -0,0 +1,120 @@
+#imports
+import pygame
+from src.label import Label
+from src.glyphatlas import GlyphAtlas
+from src.renderstats import RenderStats
+
+# label variant for frequently changing counters such as "Credits: 100" or "Wave: 1/10"
+# the prefix and the digits are pre-rasterized in a shared GlyphAtlas,
+# updating the value only blits glyph slices and never renders text with the font
+class CounterLabel(Label):
+    def __init__(self, name="Counter_Label", priority=0, prefix="", value=0, maximum=None, position=(0,0), color=(255, 255, 255), 
+                 alpha=255, font_size=24, font_path=None):
+        self.__render = None
+        self.set_prefix(prefix)
+        self.set_value(value)
+        self.set_maximum(maximum)
+        super().__init__(name=name, priority=priority, content=self.format_content(), position=position, color=color, 
+                         alpha=alpha, font_size=font_size, font_path=font_path)
+    
+    #VALIDATION METHOD:
+    @staticmethod
+    def validate_counter_label(label):
+        if not isinstance(label, CounterLabel):
+            raise TypeError("Label must be of class CounterLabel or a subclass!")
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    #PREFIX METHODS:
+    def set_prefix(self, prefix=""):
+        if not isinstance(prefix, str):
+            raise TypeError("Counter prefix must be of type string!")
+        self.__prefix = prefix
+    
+    def get_prefix(self):
+        return self.__prefix
+    
+    #VALUE METHODS:
+    def set_value(self, value=0):
+        if not isinstance(value, int):
+            raise TypeError("Counter value must be an integer!")
+        self.__value = value
+    
+    def get_value(self):
+        return self.__value
+    
+    #MAXIMUM METHODS:
+    def set_maximum(self, maximum=None):
+        if maximum is not None and not isinstance(maximum, int):
+            raise TypeError("Counter maximum must be an integer or None!")
+        self.__maximum = maximum
+    
+    def get_maximum(self):
+        return self.__maximum
+    
+    #CONTENT METHODS:
+    def get_content_parts(self):
+        parts = [self.__prefix] if self.__prefix else []
+        parts.extend(str(self.__value))
+        if self.__maximum is not None:
+            parts.append("/")
+            parts.extend(str(self.__maximum))
+        return parts
+    
+    def format_content(self):
+        return "".join(self.get_content_parts())
+    
+    #STATIC LAYER METHODS:
+    # counters are expected to change frequently, so they are never part of a cached layer
+    def is_static(self):
+        return False
+    
+    #TEXT SURFACE METHODS:
+    def get_text_surface(self):
+        return self.get_label_surface()
+    
+    #LABEL SURFACE METHODS:
+    # the label surface is reused as long as the size of the counter does not change
+    def set_label_surface(self):
+        atlas = GlyphAtlas.get_atlas(self.get_font_path(), self.get_font_size(), self.get_color())
+        parts = self.get_content_parts()
+        size = atlas.measure(parts)
+        if self.__render is None or self.__render.get_size() != size:
+            self.__render = pygame.Surface(size, pygame.SRCALPHA)
+            RenderStats.count_surface()
+        else:
+            self.__render.fill((0, 0, 0, 0))
+        atlas.compose(self.__render, parts)
+        self.__render.set_alpha(self.get_alpha())
+        self.set_size(size, trusted=True)
+    
+    def get_label_surface(self):
+        self.refresh_component()
+        return self.__render
+
+    #MAIN UPDATE METHOD
+    def rebuild_component(self):
+        self.set_font()
+        self.set_label_surface()
+        # skip the text rendering of Label, only the component boundaries are left to rebuild
+        super(Label, self).rebuild_component()
+    
+    # THE FOLLOWING ARE THE UPDATE METHODS - EACH CALLS UPDATE_COMPONENT AT THE END
+    # EACH OF THESE METHODS INCLUDES A FLAG 'UPDATE_COMPONENT' THAT CAN BE SET TO FALSE
+    # TO REDUCE REDUNDANT UPDATE_COMPONENT CALLS FOR CHILD ELEMENTS
+    def update_value(self, value, update_component = True):
+        self.set_value(value)
+        self.set_content(self.format_content())
+        if update_component:
+            self.update_component()
+    
+    def update_maximum(self, maximum, update_component = True):
+        self.set_maximum(maximum)
+        self.set_content(self.format_content())
+        if update_component:
+            self.update_component()
+    
+    def update_prefix(self, prefix, update_component = True):
+        self.set_prefix(prefix)
+        self.set_content(self.format_content())
+        if update_component:
+            self.update_component()
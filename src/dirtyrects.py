@@ -0,0 +1,61 @@
+#imports
+import pygame
+
+# collects the screen regions that changed since the last frame,
+# components report themselves whenever their state, position or surface changes
+class DirtyRects():
+    #static variables
+    enabled = False
+    full_redraw = True
+    rects = []
+    components = set()
+
+    @staticmethod
+    def set_enabled(enabled):
+        if not isinstance(enabled, bool):
+            raise TypeError("Dirty rects enabled flag must be a boolean!")
+        DirtyRects.enabled = enabled
+        DirtyRects.invalidate_all()
+    
+    @staticmethod
+    def is_enabled():
+        return DirtyRects.enabled
+    
+    @staticmethod
+    def add(rect):
+        if DirtyRects.enabled:
+            DirtyRects.rects.append(pygame.Rect(rect))
+    
+    # reports the region a component covered so far right away,
+    # the region it covers after its next rebuild is reported when the rects are flushed
+    @staticmethod
+    def add_component(component):
+        if DirtyRects.enabled:
+            previous_rect = component.get_previous_rect()
+            if previous_rect:
+                DirtyRects.rects.append(previous_rect)
+            DirtyRects.components.add(component)
+    
+    @staticmethod
+    def invalidate_all():
+        DirtyRects.full_redraw = True
+    
+    @staticmethod
+    def has_changes():
+        return DirtyRects.full_redraw or len(DirtyRects.rects) > 0 or len(DirtyRects.components) > 0
+    
+    # returns every region that needs to be repainted within the given screen rect and resets the collector
+    @staticmethod
+    def flush(screen_rect):
+        if DirtyRects.full_redraw:
+            rects = [pygame.Rect(screen_rect)]
+        else:
+            rects = DirtyRects.rects
+            for component in DirtyRects.components:
+                rects.append(component.get_rect())
+            rects = [rect.clip(screen_rect) for rect in rects]
+            rects = [rect for rect in rects if rect.width > 0 and rect.height > 0]
+        DirtyRects.rects = []
+        DirtyRects.components = set()
+        DirtyRects.full_redraw = False
+        return rects
@@ -0,0 +1,149 @@
+#imports
+import numpy as np
+from src.columnstore import ColumnStore
+from src.flowfield import FlowField
+
+# keeps every enemy of a level in contiguous arrays (one entry per enemy in each array) instead of one object per enemy,
+# so movement, damage and removal run as a few array operations per tick no matter how many enemies there are
+# positions are measured in cells, the center of cell (x, y) lies at (x + 0.5, y + 0.5)
+class EnemyStore(ColumnStore):
+    #static variables
+    columns = {
+        "ids" : (np.int32, ()),
+        "positions" : (np.float32, (2,)),
+        "previous_positions" : (np.float32, (2,)),
+        "velocities" : (np.float32, (2,)),
+        "speeds" : (np.float32, ()),
+        "health" : (np.float32, ()),
+        "maximum_health" : (np.float32, ()),
+        #cells travelled since spawning and cells left to the goal
+        "progress" : (np.float32, ()),
+        "remaining" : (np.float32, ()),
+        "rewards" : (np.int32, ())
+    }
+
+    def __init__(self, capacity=256):
+        super().__init__(capacity)
+
+    #VALIDATION METHOD:
+    @staticmethod
+    def validate_store(store):
+        if not isinstance(store, EnemyStore):
+            raise TypeError("Store must be of class EnemyStore or a subclass!")
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    #ARRAY METHODS:
+    def reset(self, capacity=256):
+        super().reset(capacity)
+        self.__next_id = 1
+
+    #the following getters return views of the live enemies only
+    def get_ids(self):
+        return self.get_column("ids")
+
+    def get_positions(self):
+        return self.get_column("positions")
+
+    def get_previous_positions(self):
+        return self.get_column("previous_positions")
+
+    def get_velocities(self):
+        return self.get_column("velocities")
+
+    def get_speeds(self):
+        return self.get_column("speeds")
+
+    def get_health(self):
+        return self.get_column("health")
+
+    def get_maximum_health(self):
+        return self.get_column("maximum_health")
+
+    def get_progress(self):
+        return self.get_column("progress")
+
+    def get_remaining(self):
+        return self.get_column("remaining")
+
+    def get_rewards(self):
+        return self.get_column("rewards")
+
+    # positions between the last two ticks, interpolation goes from 0 (previous tick) to 1 (last tick)
+    def get_interpolated_positions(self, interpolation):
+        previous_positions = self.get_previous_positions()
+        return previous_positions + (self.get_positions() - previous_positions) * interpolation
+
+    def get_cells(self):
+        return self.get_positions().astype(np.int32)
+
+    def count_in_cell(self, coords):
+        cells = self.get_cells()
+        return int(np.count_nonzero((cells[:, 0] == coords[0]) & (cells[:, 1] == coords[1])))
+
+    #SPAWNING METHODS:
+    # adds one enemy at the center of each of the given cells, returns the ids of the new enemies
+    def spawn(self, cells, speed, health, reward=1):
+        cells = np.asarray(cells, dtype=np.float32).reshape(-1, 2)
+        amount = len(cells)
+        start = self.add_rows(amount)
+        end = start + amount
+        ids = np.arange(self.__next_id, self.__next_id + amount, dtype=np.int32)
+        self.__next_id += amount
+        self.get_array("ids")[start:end] = ids
+        self.get_array("positions")[start:end] = cells + 0.5
+        self.get_array("previous_positions")[start:end] = cells + 0.5
+        self.get_array("velocities")[start:end] = 0
+        self.get_array("speeds")[start:end] = speed
+        self.get_array("health")[start:end] = health
+        self.get_array("maximum_health")[start:end] = health
+        self.get_array("progress")[start:end] = 0
+        self.get_array("remaining")[start:end] = 0
+        self.get_array("rewards")[start:end] = reward
+        return ids
+
+    #MOVEMENT METHODS:
+    # moves every enemy towards the center of the next cell the flow field points at from its current cell,
+    # the segment between a point in a cell and the center of a neighbouring cell never leaves those two cells
+    # returns a mask of the enemies that are standing in a goal cell afterwards
+    def move(self, flow_field, delta_time):
+        positions = self.get_positions()
+        self.get_previous_positions()[:] = positions
+        cells = positions.astype(np.int32)
+        next_x, next_y = flow_field.next_cells(cells[:, 0], cells[:, 1])
+        targets = np.stack((next_x, next_y), axis=1).astype(np.float32) + 0.5
+        offsets = targets - positions
+        distances = np.sqrt(np.einsum("ij,ij->i", offsets, offsets))
+        steps = np.minimum(self.get_speeds() * (delta_time / 1000), distances)
+        scale = np.divide(steps, distances, out=np.zeros_like(steps), where=distances > 0)
+        movement = offsets * scale[:, None]
+        positions += movement
+        self.get_velocities()[:] = movement / (delta_time / 1000) if delta_time > 0 else 0
+        self.get_progress()[:] += steps
+        #the distance left is the distance of the next cell plus the way to its center
+        field_distances = flow_field.get_distances()
+        target_distances = field_distances[next_y, next_x]
+        self.get_remaining()[:] = np.where(target_distances == FlowField.unreachable, np.inf, target_distances + (distances - steps))
+        cells = positions.astype(np.int32)
+        return field_distances[cells[:, 1], cells[:, 0]] == 0
+
+    #DAMAGE METHODS:
+    # damage of several hits on the same enemy adds up
+    def damage(self, indices, amounts):
+        np.subtract.at(self.get_health(), np.asarray(indices, dtype=np.intp), amounts)
+
+    def get_dead(self):
+        return self.get_health() <= 0
+
+    #REMOVAL METHODS:
+    # returns the ids and rewards of the removed enemies
+    def remove(self, mask):
+        mask = np.asarray(mask, dtype=bool)
+        if not mask.any():
+            return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32)
+        removed_ids = self.get_ids()[mask].copy()
+        removed_rewards = self.get_rewards()[mask].copy()
+        self.remove_rows(mask)
+        return removed_ids, removed_rewards
+
+    def remove_dead(self):
+        return self.remove(self.get_dead())
@@ -0,0 +1,73 @@
+#imports
+from bisect import insort
+from src.validate import Validate
+
+# routes every event only to the handlers subscribed to its event type,
+# handlers are called in priority order until one of them consumes the event
+class EventRouter():
+    def __init__(self):
+        self.reset()
+    
+    #VALIDATION METHOD:
+    @staticmethod
+    def validate_router(router):
+        if not isinstance(router, EventRouter):
+            raise TypeError("Router must be of class EventRouter or a subclass!")
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    def reset(self):
+        self.__subscribers = {}
+        self.__counter = 0
+        self.reset_counts()
+
+    #SUBSCRIPTION METHODS:
+    # subscribing a handler again replaces its previous subscription
+    def subscribe(self, event_types, handler, priority=0):
+        Validate.callback(handler)
+        Validate.priority(priority)
+        self.unsubscribe(handler)
+        for event_type in event_types:
+            insort(self.__subscribers.setdefault(event_type, []), (priority, self.__counter, handler))
+            self.__counter += 1
+    
+    def unsubscribe(self, handler):
+        for event_type in list(self.__subscribers):
+            subscribers = [subscriber for subscriber in self.__subscribers[event_type] if subscriber[2] != handler]
+            if subscribers:
+                self.__subscribers[event_type] = subscribers
+            else:
+                del self.__subscribers[event_type]
+    
+    def get_event_types(self):
+        return set(self.__subscribers)
+    
+    def get_subscribers(self, event_type):
+        return [subscriber[2] for subscriber in self.__subscribers.get(event_type, [])]
+
+    #COUNTER METHODS:
+    def reset_counts(self):
+        self.__counts = {}
+    
+    # counts per event type how many events were received, delivered to handlers and consumed
+    def get_counts(self):
+        return self.__counts
+    
+    def count(self, event_type, key):
+        counts = self.__counts.get(event_type)
+        if counts is None:
+            counts = {"received" : 0, "delivered" : 0, "consumed" : 0}
+            self.__counts[event_type] = counts
+        counts[key] += 1
+
+    #DISPATCH METHODS:
+    def dispatch(self, event):
+        self.count(event.type, "received")
+        subscribers = self.__subscribers.get(event.type)
+        if not subscribers:
+            return False
+        for priority, counter, handler in subscribers:
+            self.count(event.type, "delivered")
+            if handler(event):
+                self.count(event.type, "consumed")
+                return True
+        return False
@@ -0,0 +1,64 @@
+#imports
+from src.validate import Validate
+
+# accumulates real frame time and converts it into a number of fixed simulation steps,
+# so the simulation runs at a constant tick rate regardless of the render rate
+class FixedTimestep():
+    #static variables
+    max_frame_time = 250    #longer frames are clamped, so a stall can't cause a spiral of catch-up steps
+    max_steps = 8           #maximum steps per frame at normal speed
+
+    def __init__(self, tick_rate=60, speed=1):
+        self.set_tick_rate(tick_rate)
+        self.set_speed(speed)
+        self.reset()
+    
+    #VALIDATION METHOD:
+    @staticmethod
+    def validate_timestep(timestep):
+        if not isinstance(timestep, FixedTimestep):
+            raise TypeError("Timestep must be of class FixedTimestep or a subclass!")
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    #TICK RATE METHODS:
+    def set_tick_rate(self, tick_rate):
+        Validate.tick_rate(tick_rate)
+        self.__tick_rate = tick_rate
+        self.__step = 1000 / tick_rate
+    
+    def get_tick_rate(self):
+        return self.__tick_rate
+    
+    # the fixed simulation step in milliseconds
+    def get_step(self):
+        return self.__step
+    
+    #SPEED METHODS:
+    # the number of simulation steps per step of real time, i.e. 2 for fast forward
+    def set_speed(self, speed):
+        Validate.simulation_speed(speed)
+        self.__speed = speed
+    
+    def get_speed(self):
+        return self.__speed
+
+    #ACCUMULATOR METHODS:
+    def reset(self):
+        self.__accumulator = 0
+    
+    # adds the given frame time in milliseconds and returns the number of steps to simulate
+    def advance(self, frame_time):
+        self.__accumulator += min(frame_time, FixedTimestep.max_frame_time) * self.__speed
+        steps = int(self.__accumulator // self.__step)
+        max_steps = FixedTimestep.max_steps * self.__speed
+        if steps > max_steps:
+            # drop the time that can't be caught up with
+            steps = max_steps
+            self.__accumulator = 0
+        else:
+            self.__accumulator -= steps * self.__step
+        return steps
+    
+    # how far the current frame lies between the last and the next simulation step, from 0 to 1
+    def get_interpolation(self):
+        return min(1.0, self.__accumulator / self.__step)
@@ -0,0 +1,328 @@
+#imports
+import heapq
+from collections import deque
+import numpy as np
+from src.validate import Validate
+from src.gridstore import GridStore
+
+# a distance field from the goal cells to every walkable cell of a grid store, computed as one breadth first search,
+# every cell also stores its neighbour closest to the goal, so enemies look up their next step in constant time
+class FlowField():
+    #static variables
+    unreachable = -1
+    #neighbour offsets as (dx, dy), ties between neighbours are broken in this order
+    neighbour_steps = ((1, 0), (0, 1), (-1, 0), (0, -1))
+    neighbour_offsets = np.array(neighbour_steps, dtype=np.int32)
+
+    def __init__(self, store, goals=[]):
+        self.set_store(store)
+        self.set_goals(goals)
+        self.compute()
+
+    #VALIDATION METHOD:
+    @staticmethod
+    def validate_flow_field(flow_field):
+        if not isinstance(flow_field, FlowField):
+            raise TypeError("Flow field must be of class FlowField or a subclass!")
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    #STORE METHODS:
+    def set_store(self, store):
+        GridStore.validate_store(store)
+        self.__store = store
+        self.__flags_version = None
+
+    def get_store(self):
+        return self.__store
+
+    #GOAL METHODS:
+    def set_goals(self, goals):
+        width, height = self.__store.get_grid_size()
+        goal_mask = np.zeros((height, width), dtype=bool)
+        for coords in goals:
+            Validate.grid_coords(coords)
+            goal_mask[coords[1], coords[0]] = True
+        self.__goals = list(goals)
+        self.__goal_mask = goal_mask
+        self.__flags_version = None
+
+    def get_goals(self):
+        return self.__goals
+
+    #WALKABILITY METHODS:
+    # a view of the store's flags, cells without the blocked flag are walkable
+    def read_walkable(self):
+        width, height = self.__store.get_grid_size()
+        flags = np.frombuffer(self.__store.get_flags_array(), dtype=np.uint8).reshape(height, width)
+        return (flags & GridStore.flag_blocked) == 0
+
+    def get_walkable(self):
+        return self.__walkable
+
+    #FIELD METHODS:
+    # the field is only recomputed if a flag of the store changed since it was computed last,
+    # returns True if it was recomputed
+    def update(self):
+        if self.__flags_version == self.__store.get_flags_version():
+            return False
+        self.compute()
+        return True
+
+    # expands a wavefront from the goals one step per pass, each pass is a handful of whole array operations
+    def compute(self):
+        walkable = self.read_walkable()
+        distances = np.full(walkable.shape, FlowField.unreachable, dtype=np.int32)
+        frontier = self.__goal_mask & walkable
+        distances[frontier] = 0
+        distance = 0
+        while frontier.any():
+            distance += 1
+            reached = np.zeros_like(frontier)
+            reached[1:, :] |= frontier[:-1, :]
+            reached[:-1, :] |= frontier[1:, :]
+            reached[:, 1:] |= frontier[:, :-1]
+            reached[:, :-1] |= frontier[:, 1:]
+            frontier = reached & walkable & (distances == FlowField.unreachable)
+            distances[frontier] = distance
+        self.__walkable = walkable
+        self.__distances = distances
+        self.compute_directions()
+        self.__flags_version = self.__store.get_flags_version()
+
+    # points every reachable cell at its neighbour with the smallest distance,
+    # goal cells and unreachable cells point at themselves
+    def compute_directions(self):
+        distances = self.__distances
+        height, width = distances.shape
+        far = np.iinfo(np.int32).max
+        padded = np.full((height + 2, width + 2), far, dtype=np.int32)
+        padded[1:-1, 1:-1] = np.where(distances == FlowField.unreachable, far, distances)
+        #neighbour distances in the same order as the neighbour offsets
+        neighbour_distances = np.stack((
+            padded[1:-1, 2:],
+            padded[2:, 1:-1],
+            padded[1:-1, :-2],
+            padded[:-2, 1:-1]
+        ))
+        choices = np.argmin(neighbour_distances, axis=0)
+        moving = distances > 0
+        ys, xs = np.indices((height, width), dtype=np.int32)
+        self.__next_x = np.where(moving, xs + FlowField.neighbour_offsets[choices, 0], xs)
+        self.__next_y = np.where(moving, ys + FlowField.neighbour_offsets[choices, 1], ys)
+
+    # recomputes the next cells of the given cells only, with the same tie breaking as compute_directions
+    def update_directions(self, cells):
+        distances = self.__distances
+        height, width = distances.shape
+        for x, y in cells:
+            distance = distances[y, x]
+            next_cell = (x, y)
+            if distance > 0:
+                best = distance
+                for dx, dy in FlowField.neighbour_steps:
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < width and 0 <= ny < height:
+                        neighbour_distance = distances[ny, nx]
+                        if neighbour_distance != FlowField.unreachable and neighbour_distance < best:
+                            best = neighbour_distance
+                            next_cell = (nx, ny)
+            self.__next_x[y, x], self.__next_y[y, x] = next_cell
+
+    def get_distances(self):
+        return self.__distances
+
+    def get_distance(self, coords):
+        return int(self.__distances[coords[1], coords[0]])
+
+    def is_reachable(self, coords):
+        return self.__distances[coords[1], coords[0]] != FlowField.unreachable
+
+    def next_cell(self, coords):
+        x, y = coords
+        return (int(self.__next_x[y, x]), int(self.__next_y[y, x]))
+
+    # the next cells for whole arrays of cell coordinates at once
+    def next_cells(self, xs, ys):
+        return self.__next_x[ys, xs], self.__next_y[ys, xs]
+
+    #INCREMENTAL REPAIR METHODS:
+    # blocking or opening a single cell only repairs the part of the field that depends on it,
+    # the store's flag is changed here so the field stays in sync with the store
+    # all cells whose path to a goal leads through the given cell, including the cell itself
+    def get_dependent_cells(self, coords):
+        distances = self.__distances
+        height, width = distances.shape
+        if not self.is_reachable(coords):
+            return []
+        cells = [tuple(coords)]
+        index = 0
+        while index < len(cells):
+            x, y = cells[index]
+            index += 1
+            child_distance = distances[y, x] + 1
+            for dx, dy in FlowField.neighbour_steps:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height and distances[ny, nx] == child_distance:
+                    if self.__next_x[ny, nx] == x and self.__next_y[ny, nx] == y:
+                        cells.append((nx, ny))
+        return cells
+
+    # only the cells depending on the blocked cell lose their distance,
+    # they are reseeded from their neighbours that kept theirs and filled in again in order of distance
+    def block_cell(self, coords):
+        self.update()
+        x, y = coords
+        index = self.__store.get_index(coords)
+        if self.__store.has_flag(index, GridStore.flag_blocked):
+            return
+        affected = self.get_dependent_cells(coords)
+        self.__store.set_flag(index, GridStore.flag_blocked)
+        self.__walkable[y, x] = False
+        self.__flags_version = self.__store.get_flags_version()
+        if not affected:
+            return
+        distances = self.__distances
+        height, width = distances.shape
+        affected_set = set(affected)
+        for ax, ay in affected:
+            distances[ay, ax] = FlowField.unreachable
+        affected_set.discard((x, y))
+        queue = []
+        for ax, ay in affected_set:
+            best = None
+            for dx, dy in FlowField.neighbour_steps:
+                nx, ny = ax + dx, ay + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    neighbour_distance = distances[ny, nx]
+                    if neighbour_distance != FlowField.unreachable and (best is None or neighbour_distance < best):
+                        best = neighbour_distance
+            if best is not None:
+                heapq.heappush(queue, (int(best) + 1, ax, ay))
+        while queue:
+            distance, cx, cy = heapq.heappop(queue)
+            if distances[cy, cx] != FlowField.unreachable:
+                continue
+            distances[cy, cx] = distance
+            for dx, dy in FlowField.neighbour_steps:
+                nx, ny = cx + dx, cy + dy
+                if (nx, ny) in affected_set and distances[ny, nx] == FlowField.unreachable:
+                    heapq.heappush(queue, (distance + 1, nx, ny))
+        self.update_directions(affected)
+
+    # distances can only shrink once a cell opens up, so the decrease spreads outwards from the opened cell
+    def open_cell(self, coords):
+        self.update()
+        x, y = coords
+        index = self.__store.get_index(coords)
+        if not self.__store.has_flag(index, GridStore.flag_blocked):
+            return
+        self.__store.clear_flag(index, GridStore.flag_blocked)
+        self.__walkable[y, x] = True
+        self.__flags_version = self.__store.get_flags_version()
+        distances = self.__distances
+        height, width = distances.shape
+        if self.__goal_mask[y, x]:
+            distance = 0
+        else:
+            distance = None
+            for dx, dy in FlowField.neighbour_steps:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    neighbour_distance = distances[ny, nx]
+                    if neighbour_distance != FlowField.unreachable and (distance is None or neighbour_distance + 1 < distance):
+                        distance = int(neighbour_distance) + 1
+        if distance is None:
+            self.update_directions([(x, y)])
+            return
+        distances[y, x] = distance
+        changed = [(x, y)]
+        queue = deque(changed)
+        while queue:
+            cx, cy = queue.popleft()
+            neighbour_distance = distances[cy, cx] + 1
+            for dx, dy in FlowField.neighbour_steps:
+                nx, ny = cx + dx, cy + dy
+                if 0 <= nx < width and 0 <= ny < height and self.__walkable[ny, nx]:
+                    if distances[ny, nx] == FlowField.unreachable or distances[ny, nx] > neighbour_distance:
+                        distances[ny, nx] = neighbour_distance
+                        changed.append((nx, ny))
+                        queue.append((nx, ny))
+        #neighbours of changed cells might now prefer a changed cell as their next cell
+        cells = set(changed)
+        for cx, cy in changed:
+            for dx, dy in FlowField.neighbour_steps:
+                nx, ny = cx + dx, cy + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    cells.add((nx, ny))
+        self.update_directions(cells)
+
+    # checks whether blocking the cell would leave none of the sources (i.e. spawn cells) with a path to a goal,
+    # only the region of cells depending on the cell is searched for a way around it
+    def would_block(self, coords, sources):
+        self.update()
+        coords = tuple(coords)
+        sources = [tuple(source) for source in sources if tuple(source) != coords and self.is_reachable(source)]
+        if not sources:
+            return True
+        if not self.is_reachable(coords):
+            return False
+        affected = set(self.get_dependent_cells(coords))
+        for source in sources:
+            if source not in affected:
+                return False
+        return self.search_detour(coords, sources, affected) is None
+
+    # checks whether blocking the cell would leave any of the given cells (i.e. cells with enemies) without a path to a goal,
+    # cells that already have no path are ignored
+    def would_strand(self, coords, cells):
+        self.update()
+        coords = tuple(coords)
+        cells = [tuple(cell) for cell in cells if tuple(cell) != coords and self.is_reachable(cell)]
+        if not cells or not self.is_reachable(coords):
+            return False
+        affected = set(self.get_dependent_cells(coords))
+        #every cell a search got through to keeps its path as well, so later searches can stop there
+        detoured = set()
+        for cell in cells:
+            if cell not in affected or cell in detoured:
+                continue
+            visited = self.search_detour(coords, [cell], affected, detoured)
+            if visited is None:
+                return True
+            detoured.update(visited)
+        return False
+
+    # searches the affected cells (the ones depending on coords) from the start cells without passing coords,
+    # until it reaches a cell that keeps its path, returns the visited cells then and None if there is no way around
+    def search_detour(self, coords, starts, affected, detoured=frozenset()):
+        distances = self.__distances
+        height, width = distances.shape
+        search = list(starts)
+        visited = set(search)
+        while search:
+            cx, cy = search.pop()
+            for dx, dy in FlowField.neighbour_steps:
+                nx, ny = cx + dx, cy + dy
+                neighbour = (nx, ny)
+                if not (0 <= nx < width and 0 <= ny < height) or neighbour == coords or neighbour in visited:
+                    continue
+                if not self.__walkable[ny, nx]:
+                    continue
+                if neighbour in detoured:
+                    return visited
+                if neighbour not in affected:
+                    if distances[ny, nx] != FlowField.unreachable:
+                        return visited
+                    continue
+                visited.add(neighbour)
+                search.append(neighbour)
+        return None
+
+    # follows the field from the given cell to a goal, returns an empty path if no goal can be reached
+    def get_path(self, coords):
+        if not self.is_reachable(coords):
+            return []
+        path = [tuple(coords)]
+        while self.get_distance(path[-1]) > 0:
+            path.append(self.next_cell(path[-1]))
+        return path
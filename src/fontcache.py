@@ -0,0 +1,29 @@
+#imports
+import pygame
+from src.validate import Validate
+
+# process-wide cache of pygame fonts shared by all labels,
+# every (font path, font size) combination is only loaded once
+class FontCache():
+    #static variables
+    fonts = {}
+
+    @staticmethod
+    def get_font(font_path=None, font_size=24):
+        key = (font_path, font_size)
+        font = FontCache.fonts.get(key)
+        if font is None:
+            Validate.font_path(font_path)
+            Validate.font_size(font_size)
+            font = pygame.font.Font(font_path, font_size)
+            FontCache.fonts[key] = font
+        return font
+    
+    @staticmethod
+    def get_font_count():
+        return len(FontCache.fonts)
+    
+    # cached fonts become invalid once pygame quits
+    @staticmethod
+    def clear():
+        FontCache.fonts.clear()
@@ -0,0 +1,125 @@
+#imports
+import json
+import math
+import time
+from collections import deque
+from src.renderstats import RenderStats
+
+# records per phase timings and counters of the most recent frames in a ring buffer,
+# rolling percentiles over the buffered frames show where frames are dropped
+class FrameProfiler():
+    #static variables
+    phases = ("events", "update", "render")
+    metrics = ("frame_ms", "work_ms", "events_ms", "update_ms", "render_ms", "events", "blits", "surfaces")
+    percentiles = (50, 95, 99)
+
+    def __init__(self, capacity=600, enabled=False):
+        self.set_capacity(capacity)
+        self.set_enabled(enabled)
+
+    #VALIDATION METHOD:
+    @staticmethod
+    def validate_profiler(profiler):
+        if not isinstance(profiler, FrameProfiler):
+            raise TypeError("Profiler must be of class FrameProfiler or a subclass!")
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    #CAPACITY METHODS:
+    # the number of frames kept in the ring buffer, older frames are dropped
+    def set_capacity(self, capacity):
+        if not isinstance(capacity, int):
+            raise TypeError("Profiler capacity must be an integer!")
+        if capacity < 1:
+            raise ValueError("Profiler capacity must be at least 1!")
+        self.__capacity = capacity
+        self.reset()
+
+    def get_capacity(self):
+        return self.__capacity
+
+    #ENABLED METHODS:
+    # a disabled profiler runs the phases without measuring them
+    def set_enabled(self, enabled):
+        if not isinstance(enabled, bool):
+            raise TypeError("Profiler enabled flag must be a boolean!")
+        self.__enabled = enabled
+        self.begin_frame()
+
+    def is_enabled(self):
+        return self.__enabled
+
+    #RECORDING METHODS:
+    def reset(self):
+        self.__frames = deque(maxlen=self.__capacity)
+        self.__total_frames = 0
+        self.begin_frame()
+
+    def begin_frame(self):
+        self.__phase_times = dict.fromkeys(FrameProfiler.phases, 0.0)
+        self.__event_count = 0
+        RenderStats.reset()
+
+    # calls the function of a phase and adds the time it took to the current frame
+    def run_phase(self, phase, function, *arguments):
+        if not self.__enabled:
+            return function(*arguments)
+        start_time = time.perf_counter()
+        result = function(*arguments)
+        self.__phase_times[phase] += (time.perf_counter() - start_time) * 1000
+        return result
+
+    def count_events(self, count):
+        self.__event_count += count
+
+    # stores the current frame in the ring buffer and starts the next one,
+    # frame_time is the full duration of the frame including the time spent waiting
+    def end_frame(self, frame_time):
+        if not self.__enabled:
+            return
+        events_ms = self.__phase_times["events"]
+        update_ms = self.__phase_times["update"]
+        render_ms = self.__phase_times["render"]
+        self.__frames.append((frame_time, events_ms + update_ms + render_ms, events_ms, update_ms, render_ms,
+                              self.__event_count, RenderStats.get_blits(), RenderStats.get_surfaces()))
+        self.__total_frames += 1
+        self.begin_frame()
+
+    def get_frame_count(self):
+        return len(self.__frames)
+
+    def get_total_frames(self):
+        return self.__total_frames
+
+    #STATISTICS METHODS:
+    def get_values(self, metric):
+        index = FrameProfiler.metrics.index(metric)
+        return [frame[index] for frame in self.__frames]
+
+    # nearest rank percentile of a metric over the buffered frames
+    def get_percentile(self, metric, percentile):
+        values = sorted(self.get_values(metric))
+        if not values:
+            return 0
+        rank = max(1, math.ceil(percentile / 100 * len(values)))
+        return values[rank - 1]
+
+    def get_summary(self):
+        summary = {}
+        for metric in FrameProfiler.metrics:
+            values = sorted(self.get_values(metric))
+            metric_summary = {f"p{percentile}" : self.get_percentile(metric, percentile) for percentile in FrameProfiler.percentiles}
+            metric_summary["max"] = values[-1] if values else 0
+            metric_summary["mean"] = sum(values) / len(values) if values else 0
+            summary[metric] = metric_summary
+        return summary
+
+    # writes the summary and every buffered frame to a JSON file
+    def dump(self, path):
+        report = {
+            "total_frames" : self.__total_frames,
+            "buffered_frames" : len(self.__frames),
+            "summary" : self.get_summary(),
+            "frames" : [dict(zip(FrameProfiler.metrics, frame)) for frame in self.__frames]
+        }
+        with open(path, "w") as report_file:
+            json.dump(report, report_file, indent=4)
@@ -1,8 +1,15 @@
+import pygame
 from src.validate import Validate
 from src.gameinterfacecomponent import GameInterfaceComponent
+from src.box import Box
+from src.prioritylist import PriorityList
+from src.spatialindex import SpatialIndex
+from src.renderstats import RenderStats
 
 class GameInterface():
     def __init__(self, priority=0, initial_components=None):
+        self.invalidate_layer()
+        self.reset_event_index()
         self.reset_components()
         self.set_priority(priority)
         if initial_components:
@@ -58,50 +65,171 @@ class GameInterface():
         return self.__priority
     
     #COMPONENT METHODS:
+    # components are kept in priority order by a PriorityList,
+    # so adding or removing a component never re-sorts all components
     def reset_components(self):
-        self.__components = []
+        self.__components = PriorityList()
     
-    def add_component(self, component, sort=True):
+    def add_component(self, component):
         GameInterfaceComponent.validate_component(component)
-        self.__components.append(component)
-        if sort:
-            self.sort_components()
+        if self.__components.add(component):
+            component.set_parent(self)
+            self.invalidate_layer()
+            self.invalidate_event_index()
     
     def add_components(self, components=[]):
-        for component in components:
-            if isinstance(component, GameInterfaceComponent):
-                self.add_component(component, sort=False)
-        self.sort_components()
+        added = self.__components.add_all([component for component in components if isinstance(component, GameInterfaceComponent)])
+        for component in added:
+            component.set_parent(self)
+        self.invalidate_layer()
+        self.invalidate_event_index()
     
-    def remove_component(self, component, sort=True):
+    def remove_component(self, component):
         GameInterfaceComponent.validate_component(component)
-        if component in self.__components:
-            self.__components.remove(component)
-        if sort:
-            self.sort_components()
+        if self.__components.remove(component):
+            component.set_parent(None)
+            self.invalidate_layer()
+            self.invalidate_event_index()
     
     def remove_components(self, components):
-        for component in components:
-            if isinstance(component, GameInterfaceComponent):
-                self.remove_component(component, sort=False)
-        self.sort_components()
+        removed = self.__components.remove_all([component for component in components if isinstance(component, GameInterfaceComponent)])
+        for component in removed:
+            component.set_parent(None)
+        self.invalidate_layer()
+        self.invalidate_event_index()
     
     def get_component(self, name):
+        Validate.name(name)
+        return self.__components.get_named(name)
+    
+    def on_child_renamed(self, component, previous_name):
+        self.__components.rename(component, previous_name)
+    
+    # finds a component or one of its descendants by a path of names separated by slashes,
+    # i.e. "Menu_Options_Panel/Menu_Options_Waves_Row"
+    def find(self, path):
+        Validate.name(path)
+        name, _, remaining_path = path.partition("/")
+        component = self.get_component(name)
+        if component is None or not remaining_path:
+            return component
+        if not isinstance(component, Box):
+            return None
+        return component.find(remaining_path)
+    
+    # only necessary if the priority of a component changed after it was added
+    def sort_components(self):
+        self.__components.sort()
+
+    #STATIC LAYER METHODS:
+    # all static components are flattened into one cached layer surface,
+    # the layer is rebuilt once any static component of the interface changes
+    def invalidate_layer(self):
+        self.__layer_stale = True
+    
+    def is_layer_stale(self):
+        return self.__layer_stale
+    
+    def on_child_changed(self, component):
+        if component.is_static():
+            self.invalidate_layer()
+        self.__changed_components[id(component)] = component
+    
+    def update_layer(self, size):
+        if self.__layer_stale or self.__layer.get_size() != size:
+            self.__layer = pygame.Surface(size, pygame.SRCALPHA)
+            RenderStats.count_surface()
+            for component in self.__components:
+                if component.is_visible():
+                    component.render_static(self.__layer)
+            self.__layer_stale = False
+    
+    def get_layer(self):
+        return self.__layer
+
+    #EVENT TYPE METHODS:
+    def get_event_types(self):
+        event_types = set()
         for component in self.__components:
-            if component.is_named(name):
-                return component
-        return None
+            event_types.update(component.get_event_types())
+        return frozenset(event_types)
+
+    #EVENT INDEX METHODS:
+    # pointer events are only dispatched to interactive components below the cursor,
+    # plus the ones that were below the cursor before and might need to leave their hover state
+    def reset_event_index(self):
+        self.__event_index = SpatialIndex()
+        self.__indexed_rects = {}
+        self.__changed_components = {}
+        self.__pointer_targets = []
+        self.invalidate_event_index()
+    
+    def invalidate_event_index(self):
+        self.__event_index_stale = True
+    
+    # changed components only make the index stale if an interactive component in them moved, resized or appeared,
+    # content changes (i.e. a new counter value or a hover state) keep the index as it is
+    def has_indexed_geometry_changed(self):
+        for component in self.__changed_components.values():
+            interactive_components = []
+            component.collect_interactive(interactive_components)
+            for interactive_component in interactive_components:
+                if self.__indexed_rects.get(id(interactive_component)) != interactive_component.get_rect():
+                    return True
+        return False
     
-    def sort_components(self):
-        self.__components.sort(key=lambda component: component.get_priority())
+    def update_event_index(self):
+        if self.__changed_components:
+            if not self.__event_index_stale and self.has_indexed_geometry_changed():
+                self.invalidate_event_index()
+            self.__changed_components = {}
+        if self.__event_index_stale:
+            self.__event_index.reset()
+            interactive_components = []
+            for component in self.__components:
+                component.collect_interactive(interactive_components)
+            orders = {}
+            for order, component in enumerate(interactive_components):
+                self.__event_index.insert(component, order)
+                orders[id(component)] = order
+            self.__indexed_rects = {id(component) : component.get_rect() for component in interactive_components}
+            # previous targets that are still indexed keep their place, so they still receive the event that ends their hover state
+            self.__pointer_targets = [(orders[id(component)], component) for _, component in self.__pointer_targets if id(component) in orders]
+            self.__event_index_stale = False
+    
+    def get_event_index(self):
+        return self.__event_index
+    
+    def handle_pointer_event(self, event, input):
+        self.update_event_index()
+        hits = self.__event_index.query_point(event.pos)
+        hit_components = set(entry[1] for entry in hits)
+        exits = [entry for entry in self.__pointer_targets if entry[1] not in hit_components]
+        # button presses don't reset hover states, so previous targets have to be kept
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            self.__pointer_targets = hits + exits
+        else:
+            self.__pointer_targets = hits
+        for order, component in sorted(hits + exits, key=lambda entry: entry[0]):
+            if component.is_active():
+                if component.handle_event(event, input):
+                    return True
+        return False
 
     #GAMELOOP METHODS:
+    # non-static components are always drawn on top of the static layer,
+    # see GameInterfaceManager.init_interfaces for what this means for priorities
     def render(self, screen):
+        self.update_layer(screen.get_size())
+        screen.blit(self.__layer, (0, 0))
+        RenderStats.count_blit()
         for component in self.__components:
             if component.is_visible():
-                component.render(screen)
+                component.render_dynamic(screen)
     
     def handle_event(self, event, input):
+        if event.type in GameInterfaceComponent.pointer_event_types:
+            return self.handle_pointer_event(event, input)
         for component in self.__components:
             if component.is_active():
                 if component.handle_event(event, input):
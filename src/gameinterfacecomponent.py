@@ -1,9 +1,16 @@
 import pygame
 from src.alignment import Alignment
+from src.dirtyrects import DirtyRects
 from src.validate import Validate
+from src.renderstats import RenderStats
 
 class GameInterfaceComponent():
+    #static variables
+    pointer_event_types = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP))
+
     def __init__(self, name="Component", priority=0, position=(0,0), size=(10,10), color=(255,255,255), alpha=255):
+        self.__boundaries = None
+        self.__parent = None
         self.set_name(name)
         self.set_priority(priority)
         self.set_position(position)
@@ -34,20 +41,82 @@ class GameInterfaceComponent():
     #VISIBILITY METHODS:
     def hide(self):
         self.__visible = False
+        DirtyRects.add_component(self)
+        self.notify_parent(self)
     
     def show(self):
         self.__visible = True
+        DirtyRects.add_component(self)
+        self.notify_parent(self)
     
     def is_visible(self):
         return self.__visible
     
+    #PARENT METHODS:
+    # the parent is the Box, Button or GameInterface that holds this component
+    def set_parent(self, parent):
+        self.__parent = parent
+    
+    def get_parent(self):
+        return self.__parent
+    
+    # changes are passed up the component tree, so interfaces can invalidate their cached layers
+    def notify_parent(self, component):
+        if self.__parent:
+            self.__parent.on_child_changed(component)
+    
+    def on_child_changed(self, component):
+        self.notify_parent(component)
+    
+    # only containers that index their children by name need to react to renamed children
+    def on_child_renamed(self, component, previous_name):
+        pass
+
+    #STATIC LAYER METHODS:
+    # static components are flattened into the cached layer of their interface,
+    # non-static components are drawn on top of that layer every frame
+    def is_static(self):
+        return True
+    
+    def render_static(self, screen):
+        if self.is_static():
+            self.render(screen)
+    
+    def render_dynamic(self, screen):
+        if not self.is_static():
+            self.render(screen)
+
+    #EVENT TYPE METHODS:
+    # the event types a component handles, events of other types are never routed to it
+    def get_event_types(self):
+        return frozenset()
+
+    #INTERACTIVITY METHODS:
+    # interactive components are the ones pointer events are dispatched to
+    def is_interactive(self):
+        return False
+    
+    def collect_interactive(self, components):
+        if self.is_interactive():
+            components.append(self)
+    
+    #DESCENDANT METHODS:
+    # the components that move along with this one (i.e. the children of a box), collected into one flat list
+    def collect_descendants(self, components):
+        pass
+
     #NAME METHODS:
     def get_name(self):
         return self.__name
     
     def set_name(self, name):
         Validate.name(name)
-        self.__name = name
+        if self.__parent:
+            previous_name = self.__name
+            self.__name = name
+            self.__parent.on_child_renamed(self, previous_name)
+        else:
+            self.__name = name
     
     def is_named(self, name):
         Validate.name(name)
@@ -62,8 +131,9 @@ class GameInterfaceComponent():
         return self.__priority
     
     #POSITION METHODS:
-    def set_position(self, position=(0,0)):
-        Validate.position(position)
+    def set_position(self, position=(0,0), trusted=False):
+        if not trusted:
+            Validate.position(position)
         self.__position = position
     
     def get_position(self):
@@ -104,7 +174,8 @@ class GameInterfaceComponent():
         #apply results to component position
         new_x += pos_x
         new_y += pos_y
-        component.set_position((new_x, new_y))
+        #the new position is derived from validated values only
+        component.set_position((new_x, new_y), trusted=True)
     
     # maintains the positioning of a component relative to self,
     # when self is being scaled to the given new_size.
@@ -135,21 +206,23 @@ class GameInterfaceComponent():
             GameInterfaceComponent.calc_new_position(self_left, comp_width, new_width, left_offset_ratio),
             GameInterfaceComponent.calc_new_position(self_top, comp_height, new_height, top_offset_ratio)
         )
-        component.update_position(new_position, update_component=update_component)
+        # unscaled positions are derived from validated values only
+        component.update_position(new_position, update_component=update_component, trusted=not scale_component)
     
     #SIZE METHODS:
-    def set_size(self, size=(10,10)):
-        Validate.size(size)
+    def set_size(self, size=(10,10), trusted=False):
+        if not trusted:
+            Validate.size(size)
         self.__size = size
     
     def get_size(self):
         return self.__size
     
     def get_width(self):
-        return self.__size[0]
+        return self.get_size()[0]
     
     def get_height(self):
-        return self.__size[1]
+        return self.get_size()[1]
     
     def calculate_boundaries(self):
         self.__boundaries = {
@@ -160,19 +233,33 @@ class GameInterfaceComponent():
         }
 
     def get_boundaries(self):
+        self.refresh_component()
         return self.__boundaries
     
+    def get_rect(self):
+        boundaries = self.get_boundaries()
+        return pygame.Rect(boundaries["left"], boundaries["top"], boundaries["right"] - boundaries["left"], boundaries["bottom"] - boundaries["top"])
+    
+    # the region covered by the component as of its last rebuild, None if it has never been built
+    def get_previous_rect(self):
+        boundaries = self.__boundaries
+        if boundaries is None:
+            return None
+        return pygame.Rect(boundaries["left"], boundaries["top"], boundaries["right"] - boundaries["left"], boundaries["bottom"] - boundaries["top"])
+    
     #COLOR METHODS:
-    def set_color(self, color=(255, 255, 255)):
-        Validate.color(color)
+    def set_color(self, color=(255, 255, 255), trusted=False):
+        if not trusted:
+            Validate.color(color)
         self.__color = color
     
     def get_color(self):
         return self.__color
     
     #ALPHA METHODS:
-    def set_alpha(self, alpha=255):
-        Validate.alpha(alpha)
+    def set_alpha(self, alpha=255, trusted=False):
+        if not trusted:
+            Validate.alpha(alpha)
         self.__alpha = alpha
 
     def get_alpha(self):
@@ -181,9 +268,11 @@ class GameInterfaceComponent():
     #RENDER SURFACE METHODS:
     def set_surface(self):
         self.__surface = pygame.Surface(self.get_size(), pygame.SRCALPHA)
+        RenderStats.count_surface()
         self.__surface.fill((*self.get_color(), self.get_alpha()))
     
     def get_surface(self):
+        self.refresh_component()
         return self.__surface
     
     #VARIOUS LOGIC METHODS:
@@ -209,6 +298,7 @@ class GameInterfaceComponent():
     #GAMELOOP METHODS:
     def render(self, screen):
         screen.blit(self.get_surface(), self.get_position())
+        RenderStats.count_blit()
     
     def handle_event(self, event, input):
         # Default Component doesn't handle events
@@ -219,43 +309,74 @@ class GameInterfaceComponent():
         # Override in subclasses for specific behavior
         pass
     
-    #MAIN UPDATE METHOD
+    #MAIN UPDATE METHODS
+    # update_component only marks the component as stale, the boundaries and the surface
+    # are rebuilt lazily by refresh_component once they are needed for rendering or hit testing
     def update_component(self):
+        self.__stale = True
+        DirtyRects.add_component(self)
+        self.notify_parent(self)
+    
+    def is_stale(self):
+        return self.__stale
+    
+    def refresh_component(self):
+        if self.__stale:
+            self.__stale = False
+            self.rebuild_component()
+    
+    # subclasses extend rebuild_component with their own surfaces
+    def rebuild_component(self):
         self.calculate_boundaries()
         self.set_surface()
 
     # THE FOLLOWING ARE THE UPDATE METHODS - EACH CALLS UPDATE_COMPONENT AT THE END
     # EACH OF THESE METHODS INCLUDES A FLAG 'UPDATE_COMPONENT' THAT CAN BE SET TO FALSE
     # TO REDUCE REDUNDANT UPDATE_COMPONENT CALLS FOR CHILD ELEMENTS
-    def update_position(self, new_position, relative = False, update_component = True):
+    # EACH OF THESE METHODS ALSO INCLUDES A FLAG 'TRUSTED' THAT CAN BE SET TO TRUE
+    # TO SKIP VALIDATION FOR VALUES THAT HAVE ALREADY BEEN VALIDATED, I.E. IN HOT LOOPS
+    # all descendants are moved in one pass over a flat list of them, with trusted values,
+    # instead of one update_position call per component of the subtree
+    def update_position(self, new_position, relative = False, update_component = True, trusted = False):
         if relative:
-            #Validation necessary to ensure calculations can be made
-            Validate.position(new_position)
             current_position = self.get_position()
-            Validate.position(current_position)
+            if not trusted:
+                #Validation necessary to ensure calculations can be made
+                Validate.position(new_position)
+                Validate.position(current_position)
+            offset_x, offset_y = new_position
             new_position = (
-                current_position[0] + new_position[0],
-                current_position[1] + new_position[1]
+                current_position[0] + offset_x,
+                current_position[1] + offset_y
             )
-        self.set_position(new_position)
+        self.set_position(new_position, trusted=trusted)
+        descendants = []
+        self.collect_descendants(descendants)
+        if relative:
+            for descendant in descendants:
+                x, y = descendant.__position
+                descendant.__position = (x + offset_x, y + offset_y)
+        else:
+            for descendant in descendants:
+                descendant.__position = new_position
         if update_component:
             self.update_component()
     
-    def move(self, movement=(0,0), update_component = True):
-        self.update_position(movement, relative=True, update_component=update_component)
+    def move(self, movement=(0,0), update_component = True, trusted = False):
+        self.update_position(movement, relative=True, update_component=update_component, trusted=trusted)
     
-    def update_size(self, new_size, update_component = True):
-        self.set_size(new_size)
+    def update_size(self, new_size, update_component = True, trusted = False):
+        self.set_size(new_size, trusted=trusted)
         if update_component:
             self.update_component()
     
-    def update_color(self, color, update_component = True):
-        self.set_color(color)
+    def update_color(self, color, update_component = True, trusted = False):
+        self.set_color(color, trusted=trusted)
         if update_component:
             self.update_component()
     
-    def update_alpha(self, alpha, update_component = True):
-        self.set_alpha(alpha)
+    def update_alpha(self, alpha, update_component = True, trusted = False):
+        self.set_alpha(alpha, trusted=trusted)
         if update_component:
             self.update_component()
 
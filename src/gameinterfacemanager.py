@@ -7,6 +7,7 @@ from src.gameinterfacecomponent import GameInterfaceComponent
 from src.box import Box
 from src.button import Button
 from src.label import Label
+from src.towerstore import TowerStore
 
 class GameInterfaceManager():
     def __init__(self, screen_size):
@@ -29,6 +30,11 @@ class GameInterfaceManager():
         }
 
     #INTERFACES METHODS:
+    # priorities only order components of the same kind within an interface:
+    # static components (boxes, labels) are flattened into the cached layer of their interface,
+    # non-static components (buttons) are always drawn on top of that layer, whatever their priority,
+    # so a static component must never be placed over a button of the same interface,
+    # anything that has to cover buttons belongs into an interface of higher priority (i.e. the pause interface)
     def init_interfaces(self):
         self.__interfaces = {
             GameState.MENU : self.init_menu_interface(),
@@ -42,6 +48,10 @@ class GameInterfaceManager():
     
     def get_all(self):
         return self.__interfaces
+    
+    # finds a component within the interface of the given state by its path of names
+    def find(self, state, path):
+        return self.get_interface(state).find(path)
 
     def init_menu_interface(self):
         menu_interface = GameInterface(priority=0)
@@ -150,6 +160,13 @@ class GameInterfaceManager():
         ])
         return gameover_interface
 
+    #EVENT TYPE METHODS:
+    def get_event_types(self):
+        event_types = set()
+        for interface in self.__interfaces.values():
+            event_types.update(interface.get_event_types())
+        return frozenset(event_types)
+
     #GAMELOOP METHODS:
     def render(self, screen):
         for interface in self.__interfaces.values():
@@ -335,7 +352,9 @@ class GameInterfaceManager():
         return options_panel
 
     #GAMEPLAY INTERFACE HELPERS:
-    def generate_tower_picker(self, pos, name, cost):
+    # the cost is taken from the tower stats, so the picker always shows what placing the tower costs
+    def generate_tower_picker(self, pos, name):
+        cost = TowerStore.get_cost(name)
         #Tower Picker Button
         picker_button = Button.quick_create(
             name = f"{name}_Tower_Picker", 
@@ -369,13 +388,13 @@ class GameInterfaceManager():
             alpha = 255
         )
         # Circle Tower
-        tower_panel.add_children(self.generate_tower_picker(1, "Circle", 10))
+        tower_panel.add_children(self.generate_tower_picker(1, "Circle"))
         # Square Tower
-        tower_panel.add_children(self.generate_tower_picker(2, "Square", 25))
+        tower_panel.add_children(self.generate_tower_picker(2, "Square"))
         # Hexagon Tower
-        tower_panel.add_children(self.generate_tower_picker(3, "Hexagon", 25))
+        tower_panel.add_children(self.generate_tower_picker(3, "Hexagon"))
         # Octagon Tower
-        tower_panel.add_children(self.generate_tower_picker(4, "Octagon", 50))
+        tower_panel.add_children(self.generate_tower_picker(4, "Octagon"))
         # Return Tower Panel
         return tower_panel
 
@@ -397,6 +416,26 @@ class GameInterfaceManager():
             text_size = text_size
         )
 
+    def generate_information_counter(self, name, prefix, value, maximum=None, row=0, col=0, width=1, height=1, label_color=(0, 0, 0), 
+                                     transparency=255, text_color=(255, 255, 255), text_size=30):
+        row += 8
+        counter_position = self.multiply_tithes(col, row)
+        counter_size = self.multiply_tithes(width, height)
+        return Box.create_counter_box(
+            name = name, 
+            prefix = prefix, 
+            value = value, 
+            maximum = maximum, 
+            position = counter_position, 
+            h_align = Alignment.START, 
+            v_align = Alignment.START, 
+            size = counter_size, 
+            box_color = label_color, 
+            alpha = transparency, 
+            text_color = text_color, 
+            text_size = text_size
+        )
+
     def generate_information_button(self, name, text, row=0, col=0, width=1, height=1, padding = (4, 2)):
         row += 8
         button_position = self.multiply_tithes(col, row)
@@ -422,15 +461,15 @@ class GameInterfaceManager():
             alpha = 255
         )
         # Lives Label
-        lives_Label = self.generate_information_label("Lives_Label", "Lives: 10", width=3)
+        lives_Label = self.generate_information_counter("Lives_Label", "Lives: ", 10, width=3)
         # Credits Label
-        credits_label = self.generate_information_label("Credits_Label", "Credits: 100", row=1, width=3)
+        credits_label = self.generate_information_counter("Credits_Label", "Credits: ", 100, row=1, width=3)
         # Play Pause Button
         playpause_button = self.generate_information_button("Playpause_Button", "||", col=4)
         # Fast Forward Button
         fastforward_button = self.generate_information_button("Fastforward_Button", ">>", col=5)
         # Waves Label
-        waves_Label = self.generate_information_label("Waves_Label", "Wave: 1/10", row=1, col=4, width=2)
+        waves_Label = self.generate_information_counter("Waves_Label", "Wave: ", 1, maximum=10, row=1, col=4, width=2)
         # Main Menu Button
         main_manu_button = self.generate_information_button("Main_Menu_Button", "Main Menu", col=7, width=3)
         # Quit Game Button
@@ -13,6 +13,8 @@ class GameSettings():
         self.game_settings = {}
         self.settings_options = {}
         self.selected_options = {}
+        #settings overridden for a single session are never saved
+        self.persistent = True
         #start initial loading
         self.load_defaults()
         self.load_settings()
@@ -58,9 +60,18 @@ class GameSettings():
             self.save_settings()
     
     def save_settings(self):
+        if not self.persistent:
+            return
         with open(self.settings_path, "w") as settings_file:
             json.dump(self.game_settings, settings_file, indent=4)
 
+    # uses the given settings for this session only, i.e. the settings a replayed session was recorded with
+    def override_settings(self, settings):
+        self.game_settings = settings.copy()
+        self.persistent = False
+        self.check_settings()
+        self.load_selected_options()
+
     def get_setting(self, key):
         if key in self.game_settings:
             return self.game_settings[key]
@@ -0,0 +1,95 @@
+#imports
+import pygame
+from src.fontcache import FontCache
+from src.validate import Validate
+from src.renderstats import RenderStats
+
+# a single surface holding pre-rasterized glyphs and fixed strings (i.e. label prefixes)
+# for one font, font size and color, text is composed by blitting slices of it
+class GlyphAtlas():
+    #static variables
+    atlases = {}
+    default_glyphs = "0123456789/-"
+
+    def __init__(self, font_path=None, font_size=24, color=(255, 255, 255)):
+        Validate.font_path(font_path)
+        Validate.font_size(font_size)
+        Validate.color(color)
+        self.__font = FontCache.get_font(font_path, font_size)
+        self.__color = color
+        self.__surface = pygame.Surface((1, 1), pygame.SRCALPHA)
+        RenderStats.count_surface()
+        self.__rects = {}
+        for glyph in GlyphAtlas.default_glyphs:
+            self.add_text(glyph)
+    
+    #VALIDATION METHOD:
+    @staticmethod
+    def validate_atlas(atlas):
+        if not isinstance(atlas, GlyphAtlas):
+            raise TypeError("Atlas must be of class GlyphAtlas or a subclass!")
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    #SURFACE METHODS:
+    def get_surface(self):
+        return self.__surface
+    
+    # rasterizes the given text once and appends it to the atlas surface
+    def add_text(self, text):
+        if text in self.__rects:
+            return self.__rects[text]
+        Validate.text_content(text)
+        text_surface = self.__font.render(text, True, self.__color)
+        RenderStats.count_surface()
+        atlas_width, atlas_height = self.__surface.get_size()
+        offset = atlas_width if self.__rects else 0
+        text_width, text_height = text_surface.get_size()
+        new_surface = pygame.Surface((offset + text_width, max(atlas_height, text_height)), pygame.SRCALPHA)
+        RenderStats.count_surface()
+        if self.__rects:
+            new_surface.blit(self.__surface, (0, 0))
+            RenderStats.count_blit()
+        new_surface.blit(text_surface, (offset, 0))
+        RenderStats.count_blit()
+        self.__surface = new_surface
+        self.__rects[text] = pygame.Rect(offset, 0, text_width, text_height)
+        return self.__rects[text]
+    
+    def get_rect(self, text):
+        return self.add_text(text)
+    
+    def has_text(self, text):
+        return text in self.__rects
+
+    #COMPOSITION METHODS:
+    def measure(self, parts):
+        width = 0
+        height = 0
+        for part in parts:
+            rect = self.add_text(part)
+            width += rect.width
+            height = max(height, rect.height)
+        return (max(1, width), max(1, height))
+    
+    def compose(self, surface, parts, position=(0, 0)):
+        x, y = position
+        for part in parts:
+            rect = self.__rects[part]
+            surface.blit(self.__surface, (x, y), rect)
+            RenderStats.count_blit()
+            x += rect.width
+
+    #THE FOLLOWING ARE ANY STATIC METHODS:
+    # atlases are shared between all labels using the same font, size and color
+    @staticmethod
+    def get_atlas(font_path=None, font_size=24, color=(255, 255, 255)):
+        key = (font_path, font_size, color)
+        atlas = GlyphAtlas.atlases.get(key)
+        if atlas is None:
+            atlas = GlyphAtlas(font_path=font_path, font_size=font_size, color=color)
+            GlyphAtlas.atlases[key] = atlas
+        return atlas
+    
+    @staticmethod
+    def clear():
+        GlyphAtlas.atlases.clear()
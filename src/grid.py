@@ -1,13 +1,25 @@
 #imports
+import pygame
 from src.validate import Validate
 from src.gameinterfacecomponent import GameInterfaceComponent
+from src.dirtyrects import DirtyRects
 from src.gridcell import GridCell
+from src.gridcellview import GridCellView
+from src.gridstore import GridStore
+from src.tileatlas import TileAtlas
+from src.renderstats import RenderStats
 
 class Grid(GameInterfaceComponent):
-    def __init__(self, name="Grid", position=(0,0), grid_size=(1,1), cell_size=(8,8)):
+    def __init__(self, name="Grid", position=(0,0), grid_size=(1,1), cell_size=(8,8), layered=True, compact=False, cell_border_thickness=1, cell_border_color=(255, 255, 255)):
         self.set_grid_size(grid_size)
         self.set_cell_size(cell_size)
-        super().__init__(name=name, position=position)
+        self.set_cell_border_thickness(cell_border_thickness)
+        self.set_cell_border_color(cell_border_color)
+        self.set_layered(layered)
+        self.set_compact(compact)
+        self.reset_dirty_cells()
+        self.__atlas = TileAtlas()
+        super().__init__(name=name, position=position, size=Grid.calc_grid_dimensions(grid_size, cell_size))
         self.reset()
     
     #VALIDATION METHOD:
@@ -28,6 +40,15 @@ class Grid(GameInterfaceComponent):
             grid_x + (x*w),
             grid_y + (h*y)
         )
+    
+    @staticmethod
+    def calc_grid_dimensions(grid_size, cell_size):
+        Validate.grid_coords(grid_size)
+        Validate.cell_size(cell_size)
+        return (
+            max(1, grid_size[0] * cell_size[0]),
+            max(1, grid_size[1] * cell_size[1])
+        )
 
     #SETTERS, GETTERS AND OTHER CLASS METHODS:
     #GRID SIZE METHODS:
@@ -49,32 +70,207 @@ class Grid(GameInterfaceComponent):
     def get_cell_size(self):
         return self.__cell_size
 
+    #CELL BORDER METHODS:
+    def set_cell_border_thickness(self, border_thickness):
+        Validate.cell_border_thickness(border_thickness)
+        self.__cell_border_thickness = border_thickness
+    
+    def get_cell_border_thickness(self):
+        return self.__cell_border_thickness
+    
+    def set_cell_border_color(self, border_color):
+        Validate.color(border_color)
+        self.__cell_border_color = border_color
+    
+    def get_cell_border_color(self):
+        return self.__cell_border_color
+
+    #COMPACT BACKEND METHODS:
+    # a compact grid keeps all cell state in its GridStore and never builds GridCell objects,
+    # cells are handed out as lightweight GridCellView objects on demand instead
+    def set_compact(self, compact):
+        if not isinstance(compact, bool):
+            raise TypeError("Compact flag must be a boolean!")
+        self.__compact = compact
+    
+    def is_compact(self):
+        return self.__compact
+    
+    def get_store(self):
+        return self.__store
+
+    #LAYERED RENDERING METHODS:
+    # a layered grid composes all of its cells into a single cached layer surface,
+    # only cells whose tile state changed are redrawn onto that layer
+    def set_layered(self, layered):
+        if not isinstance(layered, bool):
+            raise TypeError("Layered flag must be a boolean!")
+        self.__layered = layered
+    
+    def is_layered(self):
+        return self.__layered
+
+    #ATLAS METHODS:
+    def get_atlas(self):
+        return self.__atlas
+    
+    def get_tile_surface(self, state):
+        return self.__atlas.get_surface(state, self.get_cell_size(), self.get_cell_border_thickness(), self.get_cell_border_color())
+
+    #DIRTY CELL METHODS:
+    def reset_dirty_cells(self):
+        self.__dirty_cells = set()
+        self.__redraw_all = True
+    
+    # marks the cell for a redraw on the layer and reports its screen region
+    def mark_coords_dirty(self, coords):
+        self.__dirty_cells.add(coords)
+        if DirtyRects.is_enabled():
+            grid_x, grid_y = self.get_position()
+            cell_width, cell_height = self.get_cell_size()
+            DirtyRects.add((grid_x + coords[0]*cell_width, grid_y + coords[1]*cell_height, cell_width, cell_height))
+    
+    # called by GridCells whenever their tile state changes
+    def on_cell_changed(self, cell):
+        coords = cell.get_coords()
+        self.__store.set_tile_state(self.__store.get_index(coords), cell.get_tile_state())
+        self.mark_coords_dirty(coords)
+    
+    def mark_all_dirty(self):
+        self.__redraw_all = True
+    
+    def get_dirty_cells(self):
+        return self.__dirty_cells
+
     #CELLS METHODS:
     def reset(self):
         base_position = self.get_position()
         width, height = self.get_grid_size()
         cell_size = self.get_cell_size()
-        self.__cells = [[
-                GridCell(name=f"GridCell({x},{y})", position=Grid.calc_cell_position(base_position, (x, y), cell_size), coords=(x, y), size=cell_size) 
-                for x in range(width)] for y in range(height)]
+        border_thickness = self.get_cell_border_thickness()
+        border_color = self.get_cell_border_color()
+        self.__store = GridStore(self.get_grid_size())
+        if self.is_compact():
+            self.__cells = None
+        else:
+            self.__cells = [[
+                    GridCell(name=f"GridCell({x},{y})", position=Grid.calc_cell_position(base_position, (x, y), cell_size), coords=(x, y), size=cell_size, 
+                             border_thickness=border_thickness, border_color=border_color, change_callback=self.on_cell_changed, atlas=self.__atlas) 
+                    for x in range(width)] for y in range(height)]
+        self.reset_dirty_cells()
+        self.__hovered_coords = None
     
     def get_cell(self, coords):
         Validate.grid_coords(coords)
         self.validate_coordinates(coords)
         x, y = coords
+        return self.__cell(x, y)
+    
+    # unvalidated cell access for internal loops
+    def __cell(self, x, y):
+        if self.__cells is None:
+            return GridCellView(self, (x, y), y * self.__grid_size[0] + x)
         return self.__cells[y][x]
 
+    #TILE STATE METHODS:
+    def get_tile_state(self, coords):
+        return self.__store.get_tile_state(self.__store.get_index(coords))
+    
+    def set_tile_state(self, coords, state):
+        if self.__cells is None:
+            if self.__store.set_tile_state(self.__store.get_index(coords), state):
+                self.mark_coords_dirty(coords)
+        else:
+            self.__cells[coords[1]][coords[0]].update_tile_state(state)
+
+    # maps a screen position straight to the coordinates of the cell below it,
+    # returns None if the position lies outside of the grid
+    def get_coords_at(self, pos):
+        grid_x, grid_y = self.get_position()
+        cell_width, cell_height = self.get_cell_size()
+        width, height = self.get_grid_size()
+        x = (pos[0] - grid_x) // cell_width
+        y = (pos[1] - grid_y) // cell_height
+        if 0 <= x < width and 0 <= y < height:
+            return (x, y)
+        return None
+    
+    def get_cell_at(self, pos):
+        coords = self.get_coords_at(pos)
+        if coords is None:
+            return None
+        return self.__cell(*coords)
+    
+    def get_hovered_coords(self):
+        return self.__hovered_coords
+
+    #RENDER SURFACE METHODS:
+    def set_surface(self):
+        self.__layer = pygame.Surface(self.get_size(), pygame.SRCALPHA)
+        RenderStats.count_surface()
+        self.mark_all_dirty()
+    
+    def get_surface(self):
+        self.refresh_component()
+        return self.__layer
+    
+    # blits every dirty cell onto the cached layer surface,
+    # or all cells if the layer has been (re)created since the last frame
+    def update_layer(self):
+        self.refresh_component()
+        cell_width, cell_height = self.get_cell_size()
+        if self.__redraw_all:
+            self.__layer.fill((0, 0, 0, 0))
+            width, height = self.get_grid_size()
+            dirty_cells = [(x, y) for y in range(height) for x in range(width)]
+        else:
+            dirty_cells = self.__dirty_cells
+        store = self.__store
+        for x, y in dirty_cells:
+            cell_rect = pygame.Rect(x*cell_width, y*cell_height, cell_width, cell_height)
+            if self.__cells is None:
+                cell_surface = self.get_tile_surface(store.get_tile_state(store.get_index((x, y))))
+            else:
+                cell_surface = self.__cells[y][x].get_surface()
+            self.__layer.fill((0, 0, 0, 0), cell_rect)
+            self.__layer.blit(cell_surface, cell_rect)
+            RenderStats.count_blit()
+        self.__dirty_cells.clear()
+        self.__redraw_all = False
+
+    #EVENT TYPE METHODS:
+    def get_event_types(self):
+        return GameInterfaceComponent.pointer_event_types
+
     #GAMELOOP METHODS:
     def render(self, screen):
+        if self.is_layered():
+            self.update_layer()
+            screen.blit(self.__layer, self.get_position())
+            RenderStats.count_blit()
+            return
         width, height = self.get_grid_size()
         for x in range(width):
             for y in range(height):
-                self.__cells[y][x].render(screen)
+                self.__cell(x, y).render(screen)
 
+    # only the cell under the cursor and the previously hovered cell are touched,
+    # so hovering and clicking cost the same regardless of the grid size
     def handle_event(self, event, input):
-        width, height = self.get_grid_size()
-        for x in range(width):
-            for y in range(height):
-                if self.__cells[y][x].handle_event(event, input):
-                    return True
+        if event.type == pygame.MOUSEBUTTONDOWN and input.left_mouse_click():
+            cell = self.get_cell_at(event.pos)
+            if cell:
+                #CLICK
+                cell.on_click()
+                return True
+        if event.type == pygame.MOUSEMOTION or event.type == pygame.MOUSEBUTTONUP:
+            coords = self.get_coords_at(event.pos)
+            previous_coords = self.__hovered_coords
+            if previous_coords is not None and previous_coords != coords:
+                #IDLE
+                self.__cell(*previous_coords).on_idle()
+            if coords is not None:
+                #HOVER
+                self.__cell(*coords).on_hover()
+            self.__hovered_coords = coords
         return False
@@ -3,10 +3,13 @@ import pygame
 from src.validate import Validate
 from src.gameinterfacecomponent import GameInterfaceComponent
 from src.tilestate import TileState
+from src.tileatlas import TileAtlas
 
 class GridCell(GameInterfaceComponent):
-    def __init__(self, name="GridCell", position=(0,0), coords=(0,0), size=(8,8), border_thickness=1, border_color=(255, 255, 255)):
+    def __init__(self, name="GridCell", position=(0,0), coords=(0,0), size=(8,8), border_thickness=1, border_color=(255, 255, 255), change_callback=None, atlas=None):
         self.set_tile_state(TileState.IDLE)
+        self.set_atlas(atlas)
+        self.set_change_callback(change_callback)
         self.set_coords(coords)
         self.set_border_thickness(border_thickness)
         self.set_border_color(border_color)
@@ -24,6 +27,26 @@ class GridCell(GameInterfaceComponent):
     def is_tile_state(self, state):
         return self.__tile_state == state
 
+    #CHANGE CALLBACK METHODS:
+    # the change callback is called with the cell itself whenever its tile state changes
+    def set_change_callback(self, callback):
+        if callback:
+            Validate.callback(callback)
+        self.__change_callback = callback
+    
+    def get_change_callback(self):
+        return self.__change_callback
+
+    #ATLAS METHODS:
+    # cells with an atlas share its pre-rendered surfaces instead of owning their own
+    def set_atlas(self, atlas):
+        if atlas:
+            TileAtlas.validate_atlas(atlas)
+        self.__atlas = atlas
+    
+    def get_atlas(self):
+        return self.__atlas
+
     #COORDINATE METHODS:
     def set_coords(self, coords):
         Validate.grid_coords(coords)
@@ -61,18 +84,19 @@ class GridCell(GameInterfaceComponent):
 
     #RENDER SURFACE METHODS:
     def set_surface(self):
-        alpha = self.get_alpha()
-        border_thickness = self.get_border_thickness()
-        
-        tile_surface = pygame.Surface(self.get_tile_size(), pygame.SRCALPHA)
-        tile_surface.fill((*self.get_color(), alpha))
-        self.__surface = pygame.Surface(self.get_size(), pygame.SRCALPHA)
-        self.__surface.fill((*self.get_border_color(), alpha))
-        self.__surface.blit(tile_surface, (border_thickness, border_thickness))
+        if self.__atlas:
+            self.__surface = self.__atlas.get_surface(self.get_tile_state(), self.get_size(), self.get_border_thickness(), self.get_border_color(), self.get_alpha())
+        else:
+            self.__surface = TileAtlas.create_tile_surface(self.get_color(), self.get_size(), self.get_border_thickness(), self.get_border_color(), self.get_alpha())
     
     def get_surface(self):
+        self.refresh_component()
         return self.__surface
     
+    #EVENT TYPE METHODS:
+    def get_event_types(self):
+        return GameInterfaceComponent.pointer_event_types
+    
     #GAMELOOP METHODS:
     def render(self, screen):
         super().render(screen)
@@ -105,3 +129,5 @@ class GridCell(GameInterfaceComponent):
         if not self.is_tile_state(state):
             self.set_tile_state(state)
             self.update_color(state.value)
+            if self.__change_callback:
+                self.__change_callback(self)
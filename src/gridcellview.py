@@ -0,0 +1,76 @@
+#imports
+from src.tilestate import TileState
+from src.renderstats import RenderStats
+
+# lightweight stand-in for a GridCell of a compact Grid,
+# all state lives in the grid's GridStore and views are created on demand
+class GridCellView():
+    __slots__ = ("__grid", "__coords", "__index")
+
+    def __init__(self, grid, coords, index):
+        self.__grid = grid
+        self.__coords = coords
+        self.__index = index
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    #GRID METHODS:
+    def get_grid(self):
+        return self.__grid
+    
+    def get_index(self):
+        return self.__index
+
+    #COORDINATE METHODS:
+    def get_coords(self):
+        return self.__coords
+    
+    def get_name(self):
+        return f"GridCell({self.__coords[0]},{self.__coords[1]})"
+
+    #POSITION METHODS:
+    def get_position(self):
+        grid_x, grid_y = self.__grid.get_position()
+        cell_width, cell_height = self.__grid.get_cell_size()
+        return (
+            grid_x + (self.__coords[0] * cell_width),
+            grid_y + (self.__coords[1] * cell_height)
+        )
+    
+    def get_size(self):
+        return self.__grid.get_cell_size()
+
+    #TILE STATE METHODS:
+    def get_tile_state(self):
+        return self.__grid.get_store().get_tile_state(self.__index)
+    
+    def is_tile_state(self, state):
+        return self.get_tile_state() == state
+    
+    def update_tile_state(self, state):
+        self.__grid.set_tile_state(self.__coords, state)
+
+    #OCCUPANCY METHODS:
+    def get_occupancy(self):
+        return self.__grid.get_store().get_occupancy(self.__index)
+    
+    def is_occupied(self):
+        return self.__grid.get_store().is_occupied(self.__index)
+
+    #RENDER SURFACE METHODS:
+    def get_surface(self):
+        return self.__grid.get_tile_surface(self.get_tile_state())
+
+    #GAMELOOP METHODS:
+    def render(self, screen):
+        screen.blit(self.get_surface(), self.get_position())
+        RenderStats.count_blit()
+    
+    #EVENT METHODS:
+    def on_click(self):
+        self.update_tile_state(TileState.ACTIVE)
+
+    def on_hover(self):
+        self.update_tile_state(TileState.HOVER)
+
+    def on_idle(self):
+        self.update_tile_state(TileState.IDLE)
@@ -0,0 +1,108 @@
+#imports
+from array import array
+from src.validate import Validate
+from src.tilestate import TileState
+
+class GridStore():
+    #static variables
+    tile_states = list(TileState)
+    tile_state_indices = {state : index for index, state in enumerate(tile_states)}
+    #cell flags (bitmask values)
+    flag_blocked = 1
+    #occupancy value of a cell without an occupant
+    unoccupied = 0
+
+    def __init__(self, grid_size=(1,1)):
+        self.set_grid_size(grid_size)
+        self.__flags_version = 0
+        self.reset()
+    
+    #VALIDATION METHOD:
+    @staticmethod
+    def validate_store(store):
+        if not isinstance(store, GridStore):
+            raise TypeError("Store must be of class GridStore or a subclass!")
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    #GRID SIZE METHODS:
+    def set_grid_size(self, grid_size):
+        Validate.grid_coords(grid_size)
+        self.__grid_size = grid_size
+    
+    def get_grid_size(self):
+        return self.__grid_size
+    
+    def get_cell_count(self):
+        return self.__grid_size[0] * self.__grid_size[1]
+
+    #INDEX METHODS:
+    # all per-cell arrays are flat and indexed by y*width+x
+    def get_index(self, coords):
+        return coords[1] * self.__grid_size[0] + coords[0]
+    
+    def get_coords(self, index):
+        y, x = divmod(index, self.__grid_size[0])
+        return (x, y)
+
+    #ARRAY METHODS:
+    def reset(self):
+        cell_count = self.get_cell_count()
+        self.__tile_states = array("B", bytes(cell_count))
+        self.__occupancy = array("H", [GridStore.unoccupied]) * cell_count
+        self.__flags = array("B", bytes(cell_count))
+        self.__flags_version += 1
+    
+    def get_tile_states_array(self):
+        return self.__tile_states
+    
+    def get_occupancy_array(self):
+        return self.__occupancy
+    
+    def get_flags_array(self):
+        return self.__flags
+
+    #TILE STATE METHODS:
+    def get_tile_state(self, index):
+        return GridStore.tile_states[self.__tile_states[index]]
+    
+    # returns True if the tile state of the cell actually changed
+    def set_tile_state(self, index, state):
+        state_index = GridStore.tile_state_indices[state]
+        if self.__tile_states[index] == state_index:
+            return False
+        self.__tile_states[index] = state_index
+        return True
+
+    #OCCUPANCY METHODS:
+    def get_occupancy(self, index):
+        return self.__occupancy[index]
+    
+    def set_occupancy(self, index, occupant):
+        self.__occupancy[index] = occupant
+    
+    def is_occupied(self, index):
+        return self.__occupancy[index] != GridStore.unoccupied
+
+    #FLAG METHODS:
+    def get_flags(self, index):
+        return self.__flags[index]
+    
+    def has_flag(self, index, flag):
+        return (self.__flags[index] & flag) != 0
+    
+    def set_flag(self, index, flag):
+        flags = self.__flags[index] | flag
+        if flags != self.__flags[index]:
+            self.__flags[index] = flags
+            self.__flags_version += 1
+    
+    def clear_flag(self, index, flag):
+        flags = self.__flags[index] & ~flag & 0xFF
+        if flags != self.__flags[index]:
+            self.__flags[index] = flags
+            self.__flags_version += 1
+    
+    # increases whenever any flag of any cell changes,
+    # so anything derived from the flags (i.e. a flow field) knows when it is outdated
+    def get_flags_version(self):
+        return self.__flags_version
@@ -33,6 +33,9 @@ class Input():
             "down" : [
                 pygame.K_s,
                 pygame.K_DOWN
+            ],
+            "profiler" : [
+                pygame.K_F3
             ]
         }
         #Key states (True if key pressed, False if not)
@@ -41,7 +44,8 @@ class Input():
             "left" : False,
             "up" : False,
             "right" : False,
-            "down" : False
+            "down" : False,
+            "profiler" : False
         }
     
     #SETTERS AND GETTERS:
@@ -112,6 +116,16 @@ class Input():
     
     def down_pressed(self):
         return self.is_key_pressed("down")
+    
+    def profiler_pressed(self):
+        return self.is_key_pressed("profiler")
+
+    #EVENT TYPE METHODS:
+    def get_event_types(self):
+        return frozenset((pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.KEYDOWN, pygame.KEYUP))
+    
+    def get_global_event_types(self):
+        return frozenset((pygame.KEYDOWN,))
 
     #THE FOLLOWING ARE ALL EVENT HANDLING AND PROCESSING METHODS:
     def handle_event(self, event):
@@ -0,0 +1,146 @@
+#imports
+import gzip
+import json
+import random
+import pygame
+
+# records the input events of every frame together with the frame times and the game settings the session started with,
+# so a session can be replayed exactly by an InputReplayer
+class InputRecorder():
+    #static variables
+    file_version = 2
+    supported_versions = (1, 2)     #version 1 recordings have no settings, they are replayed with the local settings
+    recorded_event_types = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.KEYDOWN, pygame.KEYUP))
+    recorded_attributes = ("pos", "rel", "buttons", "button", "key", "mod", "scancode", "unicode")
+
+    def __init__(self, path, seed=None, settings=None):
+        self.set_path(path)
+        self.set_seed(seed if seed is not None else random.randrange(2**31))
+        self.set_settings(settings if settings is not None else {})
+        self.reset()
+
+    #VALIDATION METHOD:
+    @staticmethod
+    def validate_recorder(recorder):
+        if not isinstance(recorder, InputRecorder):
+            raise TypeError("Recorder must be of class InputRecorder or a subclass!")
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    #PATH METHODS:
+    def set_path(self, path):
+        if not isinstance(path, str):
+            raise TypeError("Recording path must be a string!")
+        self.__path = path
+
+    def get_path(self):
+        return self.__path
+
+    #SEED METHODS:
+    # the seed of the recorded level, the replayed level is created with the same seed
+    def set_seed(self, seed):
+        if not isinstance(seed, int):
+            raise TypeError("Recording seed must be an integer!")
+        self.__seed = seed
+
+    def get_seed(self):
+        return self.__seed
+
+    #SETTINGS METHODS:
+    # the game settings at the start of the session, a copy is kept so later changes don't leak into the recording
+    def set_settings(self, settings):
+        if not isinstance(settings, dict):
+            raise TypeError("Recording settings must be a dictionary!")
+        self.__settings = dict(settings)
+
+    def get_settings(self):
+        return self.__settings
+
+    #RECORDING METHODS:
+    def reset(self):
+        self.__events = []
+        self.__frame_times = []
+
+    def get_frame_count(self):
+        return len(self.__frame_times)
+
+    def get_event_count(self):
+        return len(self.__events)
+
+    # records the events of the current frame, events the game doesn't handle are skipped
+    def record_events(self, events):
+        frame = len(self.__frame_times)
+        for event in events:
+            if event.type in InputRecorder.recorded_event_types:
+                attributes = {name : getattr(event, name) for name in InputRecorder.recorded_attributes if hasattr(event, name)}
+                self.__events.append([frame, event.type, attributes])
+
+    # ends the current frame
+    def record_frame_time(self, frame_time):
+        self.__frame_times.append(frame_time)
+
+    def save(self):
+        recording = {
+            "version" : InputRecorder.file_version,
+            "seed" : self.__seed,
+            "settings" : self.__settings,
+            "frame_times" : self.__frame_times,
+            "events" : self.__events
+        }
+        with gzip.open(self.__path, "wt", encoding="utf-8") as recording_file:
+            json.dump(recording, recording_file, separators=(",", ":"))
+
+# feeds the events and frame times of a recording back into the game loop frame by frame
+class InputReplayer():
+    def __init__(self, path):
+        self.load(path)
+
+    #VALIDATION METHOD:
+    @staticmethod
+    def validate_replayer(replayer):
+        if not isinstance(replayer, InputReplayer):
+            raise TypeError("Replayer must be of class InputReplayer or a subclass!")
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    #LOADING METHODS:
+    def load(self, path):
+        with gzip.open(path, "rt", encoding="utf-8") as recording_file:
+            recording = json.load(recording_file)
+        if recording.get("version") not in InputRecorder.supported_versions:
+            raise ValueError(f"Unsupported recording version {recording.get('version')}!")
+        self.__seed = recording["seed"]
+        self.__settings = recording.get("settings", {})
+        self.__frame_times = recording["frame_times"]
+        #events are grouped by frame, lists are turned back into the tuples pygame uses
+        self.__events = {}
+        for frame, event_type, attributes in recording["events"]:
+            for name, value in attributes.items():
+                if isinstance(value, list):
+                    attributes[name] = tuple(value)
+            self.__events.setdefault(frame, []).append(pygame.event.Event(event_type, attributes))
+        self.__frame = 0
+
+    def get_seed(self):
+        return self.__seed
+
+    # empty if the recording has no settings
+    def get_settings(self):
+        return self.__settings
+
+    def get_frame_count(self):
+        return len(self.__frame_times)
+
+    #REPLAY METHODS:
+    def get_frame(self):
+        return self.__frame
+
+    def is_finished(self):
+        return self.__frame >= len(self.__frame_times)
+
+    def get_events(self):
+        return self.__events.get(self.__frame, [])
+
+    # returns the recorded time of the current frame and moves on to the next frame
+    def next_frame(self):
+        frame_time = self.__frame_times[self.__frame]
+        self.__frame += 1
+        return frame_time
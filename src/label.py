@@ -1,11 +1,15 @@
 import pygame
 from src.gameinterfacecomponent import GameInterfaceComponent
+from src.fontcache import FontCache
+from src.textcache import TextCache
 from src.validate import Validate
+from src.renderstats import RenderStats
 
 class Label(GameInterfaceComponent):
-    def __init__(self, name="Label", priority=0, content="Text here...", position=(0,0), color=(255, 255, 255), alpha=255, font_size=24):
+    def __init__(self, name="Label", priority=0, content="Text here...", position=(0,0), color=(255, 255, 255), alpha=255, font_size=24, font_path=None):
         self.set_content(content)
         self.set_font_size(font_size)
+        self.set_font_path(font_path)
         super().__init__(name=name, priority=priority, position=position, color=color, alpha=alpha)
     
     #VALIDATION METHOD:
@@ -31,44 +35,86 @@ class Label(GameInterfaceComponent):
     def get_font_size(self):
         return self.__font_size
     
+    #FONT PATH METHODS:
+    def set_font_path(self, font_path=None):
+        Validate.font_path(font_path)
+        self.__font_path = font_path
+    
+    def get_font_path(self):
+        return self.__font_path
+    
     #FONT METHODS:
-    def set_font(self, font_path=None):
-        self.__font = pygame.font.Font(font_path, self.get_font_size())
+    # fonts are shared between all labels through the FontCache
+    def set_font(self):
+        self.__font = FontCache.get_font(self.get_font_path(), self.get_font_size())
     
     def get_font(self):
+        self.refresh_component()
         return self.__font
     
     #TEXT SURFACE METHODS:
     def set_text_surface(self):
         self.__text_surface = self.get_font().render(self.get_content(), True, self.get_color())
+        RenderStats.count_surface()
         self.set_size(self.__text_surface.get_rect().size)
 
     def get_text_surface(self):
+        self.refresh_component()
         return self.__text_surface
     
     #LABEL SURFACE METHODS:
     def set_label_surface(self):
         self.__render = pygame.Surface(self.get_size(), pygame.SRCALPHA)
+        RenderStats.count_surface()
         self.__render.blit(self.get_text_surface(), (0,0))
+        RenderStats.count_blit()
         self.__render.set_alpha(self.get_alpha())
     
     def get_label_surface(self):
+        self.refresh_component()
         return self.__render
     
+    #RENDER SURFACE METHODS:
+    # labels render their label surface, so no separate component surface is needed
+    def set_surface(self):
+        pass
+    
+    def get_surface(self):
+        return self.get_label_surface()
+    
+    #TEXT CACHE METHODS:
+    def get_text_cache_key(self):
+        return (self.get_content(), self.get_font_path(), self.get_font_size(), self.get_color(), self.get_alpha())
+    
+    #SIZE METHODS:
+    # the size of a label depends on its rendered text
+    def get_size(self):
+        self.refresh_component()
+        return super().get_size()
+    
     #GAMELOOP METHODS:
     def render(self, screen):
         screen.blit(self.get_label_surface(), self.get_position())
+        RenderStats.count_blit()
     
     def handle_event(self, event, input):
         # Labels are always non-interactive
         return False
     
     #MAIN UPDATE METHOD
-    def update_component(self):
+    # text that was rendered recently is taken from the TextCache instead of being rendered again
+    def rebuild_component(self):
         self.set_font()
-        self.set_text_surface()
-        self.set_label_surface()
-        super().update_component()
+        cache_key = self.get_text_cache_key()
+        cached_surfaces = TextCache.get(cache_key)
+        if cached_surfaces:
+            self.__text_surface, self.__render = cached_surfaces
+            self.set_size(self.__text_surface.get_size(), trusted=True)
+        else:
+            self.set_text_surface()
+            self.set_label_surface()
+            TextCache.put(cache_key, (self.__text_surface, self.__render))
+        super().rebuild_component()
     
     # THE FOLLOWING ARE THE UPDATE METHODS - EACH CALLS UPDATE_COMPONENT AT THE END
     # EACH OF THESE METHODS INCLUDES A FLAG 'UPDATE_COMPONENT' THAT CAN BE SET TO FALSE
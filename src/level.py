@@ -1,14 +1,39 @@
 #imports
+import random
+import pygame
+import numpy as np
 from src.validate import Validate
 from src.gameinterfacecomponent import GameInterfaceComponent
 from src.gridcell import GridCell
 from src.grid import Grid
+from src.gridstore import GridStore
+from src.flowfield import FlowField
+from src.enemystore import EnemyStore
+from src.spatialhash import SpatialHash
+from src.towerstore import TowerStore
+from src.targeting import Targeting
+from src.waveschedule import WaveSchedule
+from src.dirtyrects import DirtyRects
+from src.renderstats import RenderStats
 
 class Level():
-    def __init__(self, waves = 10, difficulty = "Normal"):
+    #static variables
+    starting_lives = 10
+    starting_credits = 100
+    enemy_color = (255, 64, 64)
+
+    # a headless level only holds the simulation state and never creates a grid,
+    # so it can be simulated without a display, i.e. for balance sweeps and tests
+    # enemies are only sent by a wave schedule, a level without one never spawns enemies on its own
+    def __init__(self, waves = 10, difficulty = "Normal", headless = False, seed = None, wave_schedule = None):
         self.set_waves(waves)
         self.set_difficulty(difficulty)
+        self.set_headless(headless)
+        self.set_wave_schedule(wave_schedule)
+        self.set_seed(seed)
         self.create_grid()
+        self.create_flow_field()
+        self.reset_simulation()
 
     #VALIDATION METHOD:
     @staticmethod
@@ -33,6 +58,38 @@ class Level():
     def get_difficulty(self):
         return self.__difficulty
     
+    #HEADLESS METHODS:
+    def set_headless(self, headless):
+        if not isinstance(headless, bool):
+            raise TypeError("Headless flag must be a boolean!")
+        self.__headless = headless
+    
+    def is_headless(self):
+        return self.__headless
+    
+    #WAVE SCHEDULE METHODS:
+    def set_wave_schedule(self, wave_schedule):
+        if wave_schedule is not None:
+            WaveSchedule.validate_schedule(wave_schedule)
+        self.__wave_schedule = wave_schedule
+    
+    def get_wave_schedule(self):
+        return self.__wave_schedule
+    
+    #SEED METHODS:
+    # all randomness of the simulation comes from the level's own generator,
+    # so a level with a seed always plays out the same way
+    def set_seed(self, seed):
+        Validate.seed(seed)
+        self.__seed = seed
+        self.__random = random.Random(seed)
+    
+    def get_seed(self):
+        return self.__seed
+    
+    def get_random(self):
+        return self.__random
+    
     #GRID METHODS:
     def set_grid(self, grid):
         Grid.validate_grid(grid)
@@ -41,6 +98,12 @@ class Level():
     def get_grid(self):
         return self.__grid
     
+    # the simulation works on the grid store only, a headless level owns the store without a grid
+    def get_store(self):
+        if self.__grid is None:
+            return self.__store
+        return self.__grid.get_store()
+    
     def calc_grid_size(self):
         waves = self.get_waves()
         waves_modifier = round(waves / 5) - 1
@@ -61,14 +124,280 @@ class Level():
 
     def create_grid(self):
         grid_size = self.calc_grid_size()
-        self.set_grid(Grid(name="Gameplay_Grid", position=(0, 0), grid_size=grid_size, cell_size=(32, 32)))
+        if self.is_headless():
+            self.__grid = None
+            self.__store = GridStore(grid_size)
+        else:
+            self.set_grid(Grid(name="Gameplay_Grid", position=(0, 0), grid_size=grid_size, cell_size=(32, 32), compact=True))
+            self.__store = None
+            self.create_enemy_surface()
+    
+    #PATHING METHODS:
+    # enemies enter the grid on its left edge and leave it on its right edge
+    def get_spawn_cells(self):
+        width, height = self.get_store().get_grid_size()
+        return [(0, y) for y in range(height)]
+    
+    def get_goal_cells(self):
+        width, height = self.get_store().get_grid_size()
+        return [(width - 1, y) for y in range(height)]
+    
+    def create_flow_field(self):
+        self.__flow_field = FlowField(self.get_store(), self.get_goal_cells())
+    
+    def get_flow_field(self):
+        return self.__flow_field
+    
+    #BLOCKER METHODS:
+    # blockers (i.e. towers) make a cell unwalkable, the flow field is repaired around them right away
+    def is_inside_grid(self, coords):
+        width, height = self.get_store().get_grid_size()
+        return 0 <= coords[0] < width and 0 <= coords[1] < height
+    
+    def is_blocked(self, coords):
+        store = self.get_store()
+        return store.has_flag(store.get_index(coords), GridStore.flag_blocked)
+    
+    # a blocker can't be placed on an existing blocker or where it would cut every spawn cell off from the goal,
+    # enemies on the board have to keep a path as well or their wave could never end
+    def can_place_blocker(self, coords):
+        Validate.grid_coords(coords)
+        if not self.is_inside_grid(coords) or self.is_blocked(coords):
+            return False
+        if self.__enemies.count_in_cell(coords) > 0:
+            return False
+        if self.__flow_field.would_block(coords, self.get_spawn_cells()):
+            return False
+        return not self.__flow_field.would_strand(coords, self.get_enemy_cells())
+    
+    # returns True if the blocker was placed
+    def place_blocker(self, coords):
+        if not self.can_place_blocker(coords):
+            return False
+        self.__flow_field.block_cell(coords)
+        return True
+    
+    # returns True if there was a blocker to remove
+    def remove_blocker(self, coords):
+        Validate.grid_coords(coords)
+        if not self.is_inside_grid(coords) or not self.is_blocked(coords):
+            return False
+        self.__flow_field.open_cell(coords)
+        return True
+    
+    #SIMULATION STATE METHODS:
+    def reset_simulation(self):
+        self.set_lives(Level.starting_lives)
+        self.set_credits(Level.starting_credits)
+        self.__wave = 1
+        if self.__wave_schedule is not None:
+            self.__wave_schedule.reset()
+        self.__ticks = 0
+        self.__elapsed_time = 0
+        self.__enemies = EnemyStore()
+        self.__enemy_hash = SpatialHash(self.get_store().get_grid_size())
+        self.__towers = TowerStore()
+        self.__rendered_enemies = 0
+    
+    def set_lives(self, lives):
+        Validate.lives(lives)
+        self.__lives = lives
+    
+    def get_lives(self):
+        return self.__lives
+    
+    def lose_lives(self, amount=1):
+        self.__lives = max(0, self.__lives - amount)
+    
+    def set_credits(self, credits):
+        Validate.credits(credits)
+        self.__credits = credits
+    
+    def get_credits(self):
+        return self.__credits
+    
+    def add_credits(self, amount):
+        self.__credits += amount
+    
+    # returns False without spending anything if there aren't enough credits
+    def spend_credits(self, amount):
+        if amount > self.__credits:
+            return False
+        self.__credits -= amount
+        return True
+    
+    def get_wave(self):
+        return self.__wave
+    
+    def next_wave(self):
+        self.__wave += 1
+    
+    def get_ticks(self):
+        return self.__ticks
+    
+    # the simulated time in milliseconds
+    def get_elapsed_time(self):
+        return self.__elapsed_time
+    
+    def is_lost(self):
+        return self.__lives <= 0
+    
+    def is_won(self):
+        return not self.is_lost() and self.__wave > self.__waves
+    
+    def is_over(self):
+        return self.is_lost() or self.is_won()
+    
+    # runs the simulation in steps of delta_time until the level is over or max_ticks is reached,
+    # returns the number of ticks that were simulated
+    def simulate(self, max_ticks, delta_time=1000/60):
+        ticks = self.__ticks
+        while not self.is_over() and self.__ticks - ticks < max_ticks:
+            self.update(delta_time)
+        return self.__ticks - ticks
+    
+    #ENEMY METHODS:
+    def get_enemies(self):
+        return self.__enemies
+    
+    # spawns one enemy on a random spawn cell, spawn cells that are cut off from the goal are skipped
+    def spawn_enemy(self, speed, health):
+        flow_field = self.__flow_field
+        spawn_cells = [cell for cell in self.get_spawn_cells() if flow_field.is_reachable(cell)]
+        if not spawn_cells:
+            return
+        self.__enemies.spawn([self.__random.choice(spawn_cells)], speed=speed, health=health)
+
+    # every cell with at least one enemy in it, once
+    def get_enemy_cells(self):
+        if self.__enemies.get_count() == 0:
+            return []
+        return [tuple(cell) for cell in np.unique(self.__enemies.get_cells(), axis=0).tolist()]
+
+    # enemies reaching the goal cost a life each
+    def update_enemies(self, delta_time):
+        enemies = self.__enemies
+        if enemies.get_count() == 0:
+            return
+        arrived = enemies.move(self.__flow_field, delta_time)
+        if arrived.any():
+            arrived_ids, arrived_rewards = enemies.remove(arrived)
+            self.lose_lives(len(arrived_ids))
+    
+    # defeated enemies grant their reward
+    def remove_dead_enemies(self):
+        dead_ids, dead_rewards = self.__enemies.remove_dead()
+        self.add_credits(int(dead_rewards.sum()))
+    
+    # the hash is rebuilt once per tick after the enemies moved, its indices are indices into the enemy store
+    def update_enemy_hash(self):
+        self.__enemy_hash.build(self.__enemies.get_positions())
+    
+    def get_enemy_hash(self):
+        return self.__enemy_hash
+    
+    # all enemies are drawn with a single blits call, in between the positions of the last two ticks
+    def render_enemies(self, screen, interpolation):
+        enemies = self.__enemies
+        count = enemies.get_count()
+        if count == 0:
+            return
+        cell_width, cell_height = self.__grid.get_cell_size()
+        enemy_width, enemy_height = self.__enemy_surface.get_size()
+        grid_x, grid_y = self.__grid.get_position()
+        positions = enemies.get_interpolated_positions(interpolation) * (cell_width, cell_height)
+        positions += (grid_x - enemy_width / 2, grid_y - enemy_height / 2)
+        surface = self.__enemy_surface
+        screen.blits([(surface, position) for position in positions.astype(np.int32).tolist()], doreturn=False)
+        RenderStats.count_blit(count)
+    
+    def create_enemy_surface(self):
+        cell_width, cell_height = self.__grid.get_cell_size()
+        radius = max(2, min(cell_width, cell_height) // 4)
+        self.__enemy_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        RenderStats.count_surface()
+        pygame.draw.circle(self.__enemy_surface, Level.enemy_color, (radius, radius), radius)
+    
+    # moving enemies change the grid every frame, so it is repainted while there are or just were any enemies
+    def report_dirty_regions(self):
+        if self.__grid is None:
+            return
+        count = self.__enemies.get_count()
+        if count > 0 or self.__rendered_enemies > 0:
+            DirtyRects.add(self.__grid.get_rect())
+        self.__rendered_enemies = count
+    
+    #TOWER METHODS:
+    def get_towers(self):
+        return self.__towers
+    
+    # returns True if the tower was placed and paid for
+    def place_tower(self, coords, shape, policy="first"):
+        Validate.tower_shape(shape)
+        Validate.targeting_policy(policy)
+        cost = TowerStore.get_cost(shape)
+        if cost > self.__credits or not self.place_blocker(coords):
+            return False
+        self.spend_credits(cost)
+        self.__towers.add(coords, shape, policy)
+        return True
+    
+    # selling a tower refunds half of its cost
+    def sell_tower(self, coords):
+        Validate.grid_coords(coords)
+        index = self.__towers.find(coords)
+        if index < 0:
+            return False
+        self.add_credits(TowerStore.get_cost(self.__towers.get_shape(index)) // 2)
+        self.__towers.remove(index)
+        self.remove_blocker(coords)
+        return True
+    
+    # every ready group of towers with the same shape and policy picks its targets in one batch and fires
+    def update_towers(self, delta_time):
+        towers = self.__towers
+        if towers.get_count() == 0:
+            return
+        towers.update_cooldowns(delta_time)
+        enemies = self.__enemies
+        if enemies.get_count() == 0:
+            return
+        for shape, policy, indices in towers.get_ready_groups():
+            targets = Targeting.select_targets(shape, policy, towers.get_positions()[indices], towers.get_ranges()[indices], enemies.get_positions(), 
+                                               enemies.get_health(), enemies.get_remaining(), self.__enemy_hash)
+            firing = targets >= 0
+            if firing.any():
+                enemies.damage(targets[firing], towers.get_damage()[indices[firing]])
+                towers.reload(indices[firing])
+    
+    #EVENT TYPE METHODS:
+    def get_event_types(self):
+        if self.__grid is None:
+            return frozenset()
+        return self.__grid.get_event_types()
     
     #GAMELOOP METHODS:
-    def render(self, screen):
+    # interpolation is the progress from 0 to 1 between the last and the next simulation step
+    def render(self, screen, interpolation=0.0):
+        if self.__grid is None:
+            return
         self.__grid.render(screen)
+        self.render_enemies(screen, interpolation)
 
     def handle_event(self, event, input):
+        if self.__grid is None:
+            return False
         return self.__grid.handle_event(event, input)
 
     def update(self, delta_time):
-        pass
+        if self.is_over():
+            return
+        self.__flow_field.update()
+        if self.__wave_schedule is not None:
+            self.__wave_schedule.update(self, delta_time)
+        self.update_enemies(delta_time)
+        self.update_enemy_hash()
+        self.update_towers(delta_time)
+        self.remove_dead_enemies()
+        self.__ticks += 1
+        self.__elapsed_time += delta_time
@@ -0,0 +1,136 @@
+#imports
+from bisect import bisect_left, bisect_right
+
+# list of components that stays ordered by priority,
+# components of equal priority keep the order in which they were added
+# components are also indexed by name for constant time lookups
+class PriorityList():
+    def __init__(self, items=None):
+        self.reset()
+        if items:
+            self.add_all(items)
+    
+    #VALIDATION METHOD:
+    @staticmethod
+    def validate_priority_list(priority_list):
+        if not isinstance(priority_list, PriorityList):
+            raise TypeError("Priority list must be of class PriorityList or a subclass!")
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    def reset(self):
+        self.__items = []
+        self.__keys = []
+        self.__item_keys = {}
+        self.__names = {}
+        self.__counter = 0
+    
+    # sort keys are (priority, insertion counter) so equal priorities keep their insertion order
+    def create_key(self, item):
+        key = (item.get_priority(), self.__counter)
+        self.__counter += 1
+        return key
+
+    #ADDING METHODS:
+    # single insertions locate their position with a binary search
+    def add(self, item):
+        if id(item) in self.__item_keys:
+            return False
+        key = self.create_key(item)
+        index = bisect_right(self.__keys, key)
+        self.__keys.insert(index, key)
+        self.__items.insert(index, item)
+        self.__item_keys[id(item)] = key
+        self.index_name(item, item.get_name())
+        return True
+    
+    # bulk insertions are sorted once, O(n log n) overall
+    def add_all(self, items):
+        added = []
+        for item in items:
+            if id(item) not in self.__item_keys:
+                key = self.create_key(item)
+                self.__item_keys[id(item)] = key
+                self.index_name(item, item.get_name())
+                added.append((key, item))
+        if added:
+            entries = sorted(list(zip(self.__keys, self.__items)) + added, key=lambda entry: entry[0])
+            self.__keys = [entry[0] for entry in entries]
+            self.__items = [entry[1] for entry in entries]
+        return [entry[1] for entry in added]
+
+    #REMOVAL METHODS:
+    # the identity index holds the sort key of every item, so it can be located with a binary search
+    def remove(self, item):
+        key = self.__item_keys.pop(id(item), None)
+        if key is None:
+            return False
+        index = bisect_left(self.__keys, key)
+        del self.__keys[index]
+        del self.__items[index]
+        self.unindex_name(item, item.get_name())
+        return True
+    
+    # bulk removals filter the list once, O(n) overall
+    def remove_all(self, items):
+        removed = []
+        for item in items:
+            if self.__item_keys.pop(id(item), None) is not None:
+                self.unindex_name(item, item.get_name())
+                removed.append(item)
+        if removed:
+            removed_ids = set(id(item) for item in removed)
+            entries = [(key, item) for key, item in zip(self.__keys, self.__items) if id(item) not in removed_ids]
+            self.__keys = [entry[0] for entry in entries]
+            self.__items = [entry[1] for entry in entries]
+        return removed
+
+    #NAME INDEX METHODS:
+    # several items may share a name, the first one in priority order is returned
+    def index_name(self, item, name):
+        self.__names.setdefault(name, []).append(item)
+    
+    def unindex_name(self, item, name):
+        named_items = self.__names.get(name)
+        if named_items:
+            named_items[:] = [named_item for named_item in named_items if named_item is not item]
+            if not named_items:
+                del self.__names[name]
+    
+    def rename(self, item, previous_name):
+        if self.contains(item):
+            self.unindex_name(item, previous_name)
+            self.index_name(item, item.get_name())
+    
+    def get_named(self, name):
+        named_items = self.__names.get(name)
+        if not named_items:
+            return None
+        if len(named_items) == 1:
+            return named_items[0]
+        return min(named_items, key=lambda item: self.__item_keys[id(item)])
+
+    #SORTING METHODS:
+    # only necessary if the priority of an item changed after it was added
+    def sort(self):
+        items = sorted(self.__items, key=lambda item: item.get_priority())
+        self.reset()
+        self.add_all(items)
+
+    #CONTAINER METHODS:
+    def get_items(self):
+        return self.__items
+    
+    def contains(self, item):
+        return id(item) in self.__item_keys
+    
+    def __contains__(self, item):
+        return self.contains(item)
+    
+    def __iter__(self):
+        return iter(self.__items)
+    
+    def __len__(self):
+        return len(self.__items)
+    
+    def __getitem__(self, index):
+        return self.__items[index]
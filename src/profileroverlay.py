@@ -0,0 +1,78 @@
+#imports
+from src.box import Box
+from src.label import Label
+from src.frameprofiler import FrameProfiler
+
+# a box of labels showing the rolling percentiles of a frame profiler,
+# the labels are only updated every few frames so the overlay barely affects what it measures
+class ProfilerOverlay():
+    #static variables
+    refresh_interval = 30
+    width = 440
+    line_height = 18
+    text_size = 20
+    padding = 4
+
+    def __init__(self, position=(0,0)):
+        self.create_box(position, ProfilerOverlay.width)
+        self.__frames_since_refresh = ProfilerOverlay.refresh_interval
+        self.hide()
+
+    #VALIDATION METHOD:
+    @staticmethod
+    def validate_overlay(overlay):
+        if not isinstance(overlay, ProfilerOverlay):
+            raise TypeError("Overlay must be of class ProfilerOverlay or a subclass!")
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    #BOX METHODS:
+    def create_box(self, position, width):
+        x, y = position
+        padding = ProfilerOverlay.padding
+        line_height = ProfilerOverlay.line_height
+        self.__labels = {}
+        children = [Label(name="Profiler_Overlay_Title", priority=1, content="Frame Profiler (F3)", position=(x+padding, y+padding),
+                          font_size=ProfilerOverlay.text_size)]
+        for row, metric in enumerate(FrameProfiler.metrics, 1):
+            label = Label(name=f"Profiler_Overlay_{metric}", priority=1, content=metric, position=(x+padding, y+padding+row*line_height),
+                          font_size=ProfilerOverlay.text_size)
+            self.__labels[metric] = label
+            children.append(label)
+        height = (len(FrameProfiler.metrics)+1) * line_height + padding*2
+        self.__box = Box(name="Profiler_Overlay", priority=100, position=position, size=(width, height), color=(0, 0, 0), alpha=224, children=children)
+
+    def get_box(self):
+        return self.__box
+
+    #VISIBILITY METHODS:
+    def hide(self):
+        self.__box.hide()
+
+    def show(self):
+        self.__frames_since_refresh = ProfilerOverlay.refresh_interval
+        self.__box.show()
+
+    def toggle(self):
+        if self.is_visible():
+            self.hide()
+        else:
+            self.show()
+
+    def is_visible(self):
+        return self.__box.is_visible()
+
+    #GAMELOOP METHODS:
+    def update(self, profiler):
+        if not self.is_visible():
+            return
+        self.__frames_since_refresh += 1
+        if self.__frames_since_refresh < ProfilerOverlay.refresh_interval:
+            return
+        self.__frames_since_refresh = 0
+        for metric, label in self.__labels.items():
+            percentiles = "  ".join(f"p{percentile} {profiler.get_percentile(metric, percentile):7.2f}" for percentile in FrameProfiler.percentiles)
+            label.update_content(f"{metric:<10} {percentiles}")
+
+    def render(self, screen):
+        if self.is_visible():
+            self.__box.render(screen)
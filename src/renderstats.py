@@ -0,0 +1,29 @@
+#imports
+
+# counts the blits and surface allocations made while rendering,
+# the frame profiler reads and resets the counters once per frame
+class RenderStats():
+    #static variables
+    blits = 0
+    surfaces = 0
+
+    @staticmethod
+    def count_blit(count=1):
+        RenderStats.blits += count
+    
+    @staticmethod
+    def count_surface(count=1):
+        RenderStats.surfaces += count
+    
+    @staticmethod
+    def get_blits():
+        return RenderStats.blits
+    
+    @staticmethod
+    def get_surfaces():
+        return RenderStats.surfaces
+    
+    @staticmethod
+    def reset():
+        RenderStats.blits = 0
+        RenderStats.surfaces = 0
@@ -0,0 +1,132 @@
+#imports
+import numpy as np
+from src.validate import Validate
+
+# a uniform grid of buckets over the level grid, aligned to its cells, holding the indices of points (i.e. enemy positions)
+# the buckets are rebuilt every tick by sorting the points by bucket, so the points of each bucket lie next to each other in one array
+# queries take the positions of many query points (i.e. towers) at once and answer all of them with array operations
+# positions are measured in cells, like the positions of the enemy store
+class SpatialHash():
+    def __init__(self, grid_size=(1,1), bucket_size=1):
+        self.set_grid_size(grid_size)
+        self.set_bucket_size(bucket_size)
+        self.build(np.zeros((0, 2), dtype=np.float32))
+
+    #VALIDATION METHOD:
+    @staticmethod
+    def validate_hash(spatial_hash):
+        if not isinstance(spatial_hash, SpatialHash):
+            raise TypeError("Spatial hash must be of class SpatialHash or a subclass!")
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    #SIZE METHODS:
+    def set_grid_size(self, grid_size):
+        Validate.grid_coords(grid_size)
+        self.__grid_size = grid_size
+
+    def get_grid_size(self):
+        return self.__grid_size
+
+    # the edge length of a bucket in cells
+    def set_bucket_size(self, bucket_size):
+        if not isinstance(bucket_size, int):
+            raise TypeError("Bucket size must be an integer!")
+        if bucket_size < 1:
+            raise ValueError("Bucket size must be at least 1!")
+        self.__bucket_size = bucket_size
+        self.__buckets_x = max(1, -(-self.__grid_size[0] // bucket_size))
+        self.__buckets_y = max(1, -(-self.__grid_size[1] // bucket_size))
+
+    def get_bucket_size(self):
+        return self.__bucket_size
+
+    #BUILD METHODS:
+    def get_bucket_coords(self, positions):
+        buckets = np.floor(positions / self.__bucket_size).astype(np.int32)
+        np.clip(buckets[:, 0], 0, self.__buckets_x - 1, out=buckets[:, 0])
+        np.clip(buckets[:, 1], 0, self.__buckets_y - 1, out=buckets[:, 1])
+        return buckets
+
+    # counts the points per bucket, the running sum of the counts gives every bucket its slice of the sorted indices
+    # a stable sort of 16 bit keys is a radix sort in numpy, so with up to 65536 buckets the sort takes linear time,
+    # more buckets fall back to a comparison sort
+    def build(self, positions):
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 2)
+        bucket_count = self.__buckets_x * self.__buckets_y
+        buckets = self.get_bucket_coords(positions)
+        keys = buckets[:, 1] * self.__buckets_x + buckets[:, 0]
+        if bucket_count <= 2**16:
+            keys = keys.astype(np.uint16)
+        counts = np.bincount(keys, minlength=bucket_count)
+        starts = np.zeros(bucket_count + 1, dtype=np.int64)
+        np.cumsum(counts, out=starts[1:])
+        self.__positions = positions
+        self.__counts = counts
+        self.__starts = starts
+        self.__order = np.argsort(keys, kind="stable")
+
+    def get_positions(self):
+        return self.__positions
+
+    def get_point_count(self):
+        return len(self.__positions)
+
+    # indices of the points in a single bucket
+    def get_bucket(self, bucket_coords):
+        key = bucket_coords[1] * self.__buckets_x + bucket_coords[0]
+        return self.__order[self.__starts[key]:self.__starts[key + 1]]
+
+    #QUERY METHODS:
+    # pairs of query and point indices for every point in a bucket touching the square of half width radius around a query point,
+    # the pairs are sorted by query index and have to be filtered by an exact distance test
+    def query_candidates(self, centers, radius):
+        centers = np.asarray(centers, dtype=np.float32).reshape(-1, 2)
+        radii = np.broadcast_to(np.asarray(radius, dtype=np.float32), (len(centers),))
+        query_count = len(centers)
+        if query_count == 0 or len(self.__positions) == 0:
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+        minimum = self.get_bucket_coords(centers - radii[:, None])
+        maximum = self.get_bucket_coords(centers + radii[:, None])
+        #every query covers a window of buckets, windows are padded to the largest one and the padding is masked out
+        span = int((maximum - minimum).max()) + 1
+        offsets = np.arange(span, dtype=np.int32)
+        bucket_x = minimum[:, 0, None, None] + offsets[None, None, :]
+        bucket_y = minimum[:, 1, None, None] + offsets[None, :, None]
+        valid = (bucket_x <= maximum[:, 0, None, None]) & (bucket_y <= maximum[:, 1, None, None])
+        keys = (bucket_y * self.__buckets_x + bucket_x)[valid]
+        queries = np.broadcast_to(np.arange(query_count)[:, None, None], valid.shape)[valid]
+        #gather the slices of all covered buckets into flat arrays of pairs
+        lengths = self.__counts[keys]
+        total = int(lengths.sum())
+        if total == 0:
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+        ends = np.cumsum(lengths)
+        slice_starts = np.repeat(self.__starts[keys] - (ends - lengths), lengths)
+        point_indices = self.__order[slice_starts + np.arange(total)]
+        query_indices = np.repeat(queries, lengths)
+        return query_indices, point_indices
+
+    # pairs of query and point indices for every point within the euclidean radius of a query point
+    def query_range(self, centers, radius):
+        centers = np.asarray(centers, dtype=np.float32).reshape(-1, 2)
+        query_indices, point_indices = self.query_candidates(centers, radius)
+        offsets = self.__positions[point_indices] - centers[query_indices]
+        squared_distances = np.einsum("ij,ij->i", offsets, offsets)
+        radii = np.broadcast_to(np.asarray(radius, dtype=np.float32), (len(centers),))[query_indices]
+        inside = squared_distances <= radii * radii
+        return query_indices[inside], point_indices[inside]
+
+    # the index of the closest point within the radius of every query point, or -1 if there is none
+    def query_nearest(self, centers, radius):
+        centers = np.asarray(centers, dtype=np.float32).reshape(-1, 2)
+        nearest = np.full(len(centers), -1, dtype=np.intp)
+        query_indices, point_indices = self.query_range(centers, radius)
+        if len(query_indices) == 0:
+            return nearest
+        offsets = self.__positions[point_indices] - centers[query_indices]
+        squared_distances = np.einsum("ij,ij->i", offsets, offsets)
+        order = np.lexsort((squared_distances, query_indices))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = query_indices[order][1:] != query_indices[order][:-1]
+        nearest[query_indices[order][first]] = point_indices[order][first]
+        return nearest
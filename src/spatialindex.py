@@ -0,0 +1,52 @@
+#imports
+from src.gameinterfacecomponent import GameInterfaceComponent
+
+# uniform bucket grid over the boundaries of interface components,
+# point queries only return components whose rect contains the point
+class SpatialIndex():
+    def __init__(self, bucket_size=64):
+        self.set_bucket_size(bucket_size)
+        self.reset()
+    
+    #VALIDATION METHOD:
+    @staticmethod
+    def validate_index(index):
+        if not isinstance(index, SpatialIndex):
+            raise TypeError("Index must be of class SpatialIndex or a subclass!")
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    #BUCKET SIZE METHODS:
+    def set_bucket_size(self, bucket_size):
+        if not isinstance(bucket_size, int):
+            raise TypeError("Bucket size must be an integer!")
+        if bucket_size < 1:
+            raise ValueError("Bucket size must be at least 1!")
+        self.__bucket_size = bucket_size
+    
+    def get_bucket_size(self):
+        return self.__bucket_size
+
+    #BUCKET METHODS:
+    def reset(self):
+        self.__buckets = {}
+        self.__count = 0
+    
+    def get_count(self):
+        return self.__count
+    
+    # components have to be inserted in dispatch order, every bucket then stays ordered by itself
+    def insert(self, component, order):
+        GameInterfaceComponent.validate_component(component)
+        boundaries = component.get_boundaries()
+        bucket_size = self.__bucket_size
+        for bucket_x in range(boundaries["left"] // bucket_size, boundaries["right"] // bucket_size + 1):
+            for bucket_y in range(boundaries["top"] // bucket_size, boundaries["bottom"] // bucket_size + 1):
+                self.__buckets.setdefault((bucket_x, bucket_y), []).append((order, component))
+        self.__count += 1
+    
+    # returns (order, component) pairs of all components containing the point, in dispatch order
+    def query_point(self, pos):
+        bucket = self.__buckets.get((pos[0] // self.__bucket_size, pos[1] // self.__bucket_size))
+        if not bucket:
+            return []
+        return [entry for entry in bucket if entry[1].mouse_over(pos)]
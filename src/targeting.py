@@ -0,0 +1,97 @@
+#imports
+import math
+import numpy as np
+from src.validate import Validate
+
+# picks one target per tower for a whole group of towers of the same shape and policy at once,
+# every tower shape has its own distance kernel, a tower reaches every enemy whose kernel distance is within its range
+# positions are measured in cells, like the positions of the enemy store
+class Targeting():
+    #static variables
+    #half width of the bounding square of a kernel with range 1, used to look up candidates in a spatial hash
+    kernel_extents = {
+        "Circle" : 1.0,
+        "Square" : 1.0,
+        "Hexagon" : 2 / math.sqrt(3),
+        "Octagon" : 1.0
+    }
+
+    #THE FOLLOWING ARE THE DISTANCE KERNELS:
+    # each kernel maps the offset arrays between towers and enemies to distances
+    @staticmethod
+    def circle_distance(dx, dy):
+        return np.sqrt(dx * dx + dy * dy)
+
+    @staticmethod
+    def square_distance(dx, dy):
+        return np.maximum(np.abs(dx), np.abs(dy))
+
+    # a hexagon with flat top and bottom edges
+    @staticmethod
+    def hexagon_distance(dx, dy):
+        dx = np.abs(dx)
+        dy = np.abs(dy)
+        return np.maximum(dy, (math.sqrt(3) * dx + dy) / 2)
+
+    @staticmethod
+    def octagon_distance(dx, dy):
+        dx = np.abs(dx)
+        dy = np.abs(dy)
+        return np.maximum(np.maximum(dx, dy), (dx + dy) / math.sqrt(2))
+
+    @staticmethod
+    def get_kernel(shape):
+        Validate.tower_shape(shape)
+        return {
+            "Circle" : Targeting.circle_distance,
+            "Square" : Targeting.square_distance,
+            "Hexagon" : Targeting.hexagon_distance,
+            "Octagon" : Targeting.octagon_distance
+        }[shape]
+
+    #THE FOLLOWING ARE THE SELECTION METHODS:
+    # the score of every tower and enemy pair, every tower picks the enemy with the lowest score
+    # first: closest to the goal, last: furthest from the goal, strongest: most health, closest: closest to the tower
+    @staticmethod
+    def get_scores(policy, enemy_indices, distances, enemy_health, enemy_remaining):
+        Validate.targeting_policy(policy)
+        if policy == "first":
+            return enemy_remaining[enemy_indices]
+        if policy == "last":
+            return -enemy_remaining[enemy_indices]
+        if policy == "strongest":
+            return -enemy_health[enemy_indices]
+        return distances
+
+    # returns the index of the target enemy of every tower, or -1 for towers without an enemy in range
+    # with a spatial hash only the enemies in buckets near a tower are tested, otherwise every tower tests every enemy
+    @staticmethod
+    def select_targets(shape, policy, tower_positions, tower_ranges, enemy_positions, enemy_health, enemy_remaining, enemy_hash=None):
+        kernel = Targeting.get_kernel(shape)
+        tower_positions = np.asarray(tower_positions, dtype=np.float32).reshape(-1, 2)
+        tower_count = len(tower_positions)
+        enemy_count = len(enemy_positions)
+        tower_ranges = np.broadcast_to(np.asarray(tower_ranges, dtype=np.float32), (tower_count,))
+        targets = np.full(tower_count, -1, dtype=np.intp)
+        if tower_count == 0 or enemy_count == 0:
+            return targets
+        if enemy_hash is not None:
+            tower_indices, enemy_indices = enemy_hash.query_candidates(tower_positions, tower_ranges * Targeting.kernel_extents[shape])
+        else:
+            tower_indices = np.repeat(np.arange(tower_count), enemy_count)
+            enemy_indices = np.tile(np.arange(enemy_count), tower_count)
+        offsets = enemy_positions[enemy_indices] - tower_positions[tower_indices]
+        distances = kernel(offsets[:, 0], offsets[:, 1])
+        inside = distances <= tower_ranges[tower_indices]
+        tower_indices = tower_indices[inside]
+        enemy_indices = enemy_indices[inside]
+        if len(tower_indices) == 0:
+            return targets
+        scores = Targeting.get_scores(policy, enemy_indices, distances[inside], enemy_health, enemy_remaining)
+        #sorted by tower, then score, ties go to the lower enemy index
+        order = np.lexsort((enemy_indices, scores, tower_indices))
+        sorted_towers = tower_indices[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = sorted_towers[1:] != sorted_towers[:-1]
+        targets[sorted_towers[first]] = enemy_indices[order][first]
+        return targets
@@ -0,0 +1,57 @@
+#imports
+from collections import OrderedDict
+
+# process-wide least recently used cache of rendered text surfaces,
+# keyed by (content, font path, font size, color, alpha)
+# cached surfaces are shared and must never be modified after they have been stored
+class TextCache():
+    #static variables
+    capacity = 256
+    entries = OrderedDict()
+    hits = 0
+    misses = 0
+
+    @staticmethod
+    def get(key):
+        surfaces = TextCache.entries.get(key)
+        if surfaces is None:
+            TextCache.misses += 1
+            return None
+        TextCache.hits += 1
+        TextCache.entries.move_to_end(key)
+        return surfaces
+    
+    @staticmethod
+    def put(key, surfaces):
+        TextCache.entries[key] = surfaces
+        TextCache.entries.move_to_end(key)
+        TextCache.evict()
+    
+    @staticmethod
+    def evict():
+        while len(TextCache.entries) > TextCache.capacity:
+            TextCache.entries.popitem(last=False)
+    
+    @staticmethod
+    def set_capacity(capacity):
+        if not isinstance(capacity, int):
+            raise TypeError("Text cache capacity must be an integer!")
+        if capacity < 1:
+            raise ValueError("Text cache capacity must be at least 1!")
+        TextCache.capacity = capacity
+        TextCache.evict()
+    
+    @staticmethod
+    def get_stats():
+        return {
+            "hits" : TextCache.hits,
+            "misses" : TextCache.misses,
+            "size" : len(TextCache.entries),
+            "capacity" : TextCache.capacity
+        }
+    
+    @staticmethod
+    def clear():
+        TextCache.entries.clear()
+        TextCache.hits = 0
+        TextCache.misses = 0
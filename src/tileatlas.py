@@ -0,0 +1,58 @@
+#imports
+import pygame
+from src.validate import Validate
+from src.tilestate import TileState
+from src.renderstats import RenderStats
+
+class TileAtlas():
+    def __init__(self):
+        self.reset()
+    
+    #VALIDATION METHOD:
+    @staticmethod
+    def validate_atlas(atlas):
+        if not isinstance(atlas, TileAtlas):
+            raise TypeError("Atlas must be of class TileAtlas or a subclass!")
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    #SURFACE METHODS:
+    def reset(self):
+        self.__surfaces = {}
+    
+    # returns the shared surface for the given combination,
+    # each combination is only rendered once per atlas
+    def get_surface(self, state, size, border_thickness, border_color, alpha=255):
+        key = (state, size, border_thickness, border_color, alpha)
+        surface = self.__surfaces.get(key)
+        if surface is None:
+            if not isinstance(state, TileState):
+                raise TypeError("Invalid TileState!")
+            Validate.cell_size(size)
+            Validate.cell_border_thickness(border_thickness)
+            Validate.color(border_color)
+            Validate.alpha(alpha)
+            surface = TileAtlas.create_tile_surface(state.value, size, border_thickness, border_color, alpha)
+            self.__surfaces[key] = surface
+        return surface
+    
+    def get_surface_count(self):
+        return len(self.__surfaces)
+
+    #THE FOLLOWING ARE ANY STATIC METHODS:
+    # creates a tile of the given color framed by a border of the given thickness
+    @staticmethod
+    def create_tile_surface(color, size, border_thickness, border_color, alpha=255):
+        width, height = size
+        tile_size = (
+            width - (border_thickness * 2),
+            height - (border_thickness * 2)
+        )
+        tile_surface = pygame.Surface(tile_size, pygame.SRCALPHA)
+        RenderStats.count_surface()
+        tile_surface.fill((*color, alpha))
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        RenderStats.count_surface()
+        surface.fill((*border_color, alpha))
+        surface.blit(tile_surface, (border_thickness, border_thickness))
+        RenderStats.count_blit()
+        return surface
@@ -0,0 +1,130 @@
+#imports
+import numpy as np
+from src.validate import Validate
+from src.columnstore import ColumnStore
+
+# keeps every tower of a level in contiguous arrays, like the enemy store does for enemies,
+# so all towers of one shape and targeting policy can pick their targets and fire together
+# positions are measured in cells, towers stand in the center of their cell
+class TowerStore(ColumnStore):
+    #static variables
+    shapes = Validate.tower_shape_options
+    policies = Validate.targeting_policy_options
+    #range in cells, damage per shot and reload time in milliseconds
+    #the costs are also shown by the tower pickers of the gameplay interface
+    tower_stats = {
+        "Circle" : {"cost" : 10, "range" : 2.5, "damage" : 2, "reload" : 400},
+        "Square" : {"cost" : 25, "range" : 2.0, "damage" : 6, "reload" : 800},
+        "Hexagon" : {"cost" : 25, "range" : 3.0, "damage" : 4, "reload" : 700},
+        "Octagon" : {"cost" : 50, "range" : 3.5, "damage" : 8, "reload" : 900}
+    }
+    columns = {
+        "coords" : (np.int32, (2,)),
+        "positions" : (np.float32, (2,)),
+        #shapes and policies are stored as their index in the shapes and policies lists
+        "shapes" : (np.uint8, ()),
+        "policies" : (np.uint8, ()),
+        "ranges" : (np.float32, ()),
+        "damage" : (np.float32, ()),
+        "reloads" : (np.float32, ()),
+        "cooldowns" : (np.float32, ())
+    }
+
+    def __init__(self, capacity=64):
+        super().__init__(capacity)
+
+    #VALIDATION METHOD:
+    @staticmethod
+    def validate_store(store):
+        if not isinstance(store, TowerStore):
+            raise TypeError("Store must be of class TowerStore or a subclass!")
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    #STATS METHODS:
+    @staticmethod
+    def get_cost(shape):
+        Validate.tower_shape(shape)
+        return TowerStore.tower_stats[shape]["cost"]
+
+    #ARRAY METHODS:
+    #the following getters return views of the placed towers only
+    def get_coords(self):
+        return self.get_column("coords")
+
+    def get_positions(self):
+        return self.get_column("positions")
+
+    def get_shapes(self):
+        return self.get_column("shapes")
+
+    def get_policies(self):
+        return self.get_column("policies")
+
+    def get_ranges(self):
+        return self.get_column("ranges")
+
+    def get_damage(self):
+        return self.get_column("damage")
+
+    def get_reloads(self):
+        return self.get_column("reloads")
+
+    def get_cooldowns(self):
+        return self.get_column("cooldowns")
+
+    # returns the index of the tower in the given cell, or -1 if there is none
+    def find(self, coords):
+        matches = np.flatnonzero((self.get_coords()[:, 0] == coords[0]) & (self.get_coords()[:, 1] == coords[1]))
+        return int(matches[0]) if len(matches) else -1
+
+    def get_shape(self, index):
+        return TowerStore.shapes[self.get_shapes()[index]]
+
+    #PLACEMENT METHODS:
+    # returns the index of the new tower
+    def add(self, coords, shape, policy="first"):
+        Validate.grid_coords(coords)
+        Validate.tower_shape(shape)
+        Validate.targeting_policy(policy)
+        stats = TowerStore.tower_stats[shape]
+        index = self.add_rows(1)
+        self.get_coords()[index] = coords
+        self.get_positions()[index] = (coords[0] + 0.5, coords[1] + 0.5)
+        self.get_shapes()[index] = TowerStore.shapes.index(shape)
+        self.get_policies()[index] = TowerStore.policies.index(policy)
+        self.get_ranges()[index] = stats["range"]
+        self.get_damage()[index] = stats["damage"]
+        self.get_reloads()[index] = stats["reload"]
+        self.get_cooldowns()[index] = 0
+        return index
+
+    def set_policy(self, index, policy):
+        Validate.targeting_policy(policy)
+        self.get_policies()[index] = TowerStore.policies.index(policy)
+
+    # the last tower takes the place of the removed one (swap remove)
+    def remove(self, index):
+        mask = np.zeros(self.get_count(), dtype=bool)
+        mask[index] = True
+        self.remove_rows(mask)
+
+    #COOLDOWN METHODS:
+    def update_cooldowns(self, delta_time):
+        cooldowns = self.get_cooldowns()
+        np.maximum(cooldowns - delta_time, 0, out=cooldowns)
+
+    # indices of the ready towers of every shape and policy combination that has any
+    def get_ready_groups(self):
+        ready = self.get_cooldowns() <= 0
+        shapes = self.get_shapes()
+        policies = self.get_policies()
+        groups = []
+        for shape_index, shape in enumerate(TowerStore.shapes):
+            for policy_index, policy in enumerate(TowerStore.policies):
+                indices = np.flatnonzero(ready & (shapes == shape_index) & (policies == policy_index))
+                if len(indices):
+                    groups.append((shape, policy, indices))
+        return groups
+
+    def reload(self, indices):
+        self.get_cooldowns()[indices] = self.get_reloads()[indices]
@@ -25,6 +25,14 @@ class Validate():
     cell_size_maximum = 256
     cell_border_thickness_minimum = 1
     cell_border_thickness_maximum = 16
+    tick_rate_minimum = 1
+    tick_rate_maximum = 1000
+    simulation_speed_minimum = 1
+    simulation_speed_maximum = 16
+    lives_minimum = 0
+    credits_minimum = 0
+    tower_shape_options = ["Circle", "Square", "Hexagon", "Octagon"]
+    targeting_policy_options = ["first", "last", "strongest", "closest"]
     waves_options = [5, 10, 15]
     difficulty_options = ["Easy", "Normal", "Hard"]
 
@@ -99,6 +107,11 @@ class Validate():
         if font_size < Validate.font_size_minimum or font_size > Validate.font_size_maximum:
             raise ValueError(f"Font size must be greater than {Validate.font_size_minimum} and at most {Validate.font_size_maximum}!")
     
+    @staticmethod
+    def font_path(font_path):
+        if font_path is not None and not isinstance(font_path, str):
+            raise TypeError("Font path must be of type string or None!")
+    
     @staticmethod
     def grid_coords(coords):
         if not isinstance(coords, tuple):
@@ -137,6 +150,53 @@ class Validate():
         if not waves in Validate.waves_options:
             raise ValueError(f"{waves} is an invalid Waves option!")
 
+    @staticmethod
+    def lives(lives):
+        if not isinstance(lives, int):
+            raise TypeError("Lives must be an integer!")
+        if lives < Validate.lives_minimum:
+            raise ValueError(f"Lives must be at least {Validate.lives_minimum}!")
+    
+    @staticmethod
+    def credits(credits):
+        if not isinstance(credits, int):
+            raise TypeError("Credits must be an integer!")
+        if credits < Validate.credits_minimum:
+            raise ValueError(f"Credits must be at least {Validate.credits_minimum}!")
+    
+    @staticmethod
+    def seed(seed):
+        if seed is not None and not isinstance(seed, int):
+            raise TypeError("Seed must be an integer or None!")
+
+    @staticmethod
+    def tower_shape(shape):
+        if not isinstance(shape, str):
+            raise TypeError("Tower shape must be a string!")
+        if not shape in Validate.tower_shape_options:
+            raise ValueError(f"{shape} is an invalid Tower shape!")
+    
+    @staticmethod
+    def targeting_policy(policy):
+        if not isinstance(policy, str):
+            raise TypeError("Targeting policy must be a string!")
+        if not policy in Validate.targeting_policy_options:
+            raise ValueError(f"{policy} is an invalid Targeting policy!")
+
+    @staticmethod
+    def tick_rate(tick_rate):
+        if not isinstance(tick_rate, int):
+            raise TypeError("Tick rate must be an integer!")
+        if tick_rate < Validate.tick_rate_minimum or tick_rate > Validate.tick_rate_maximum:
+            raise ValueError(f"Tick rate must be at least {Validate.tick_rate_minimum} and at most {Validate.tick_rate_maximum}!")
+    
+    @staticmethod
+    def simulation_speed(speed):
+        if not isinstance(speed, int):
+            raise TypeError("Simulation speed must be an integer!")
+        if speed < Validate.simulation_speed_minimum or speed > Validate.simulation_speed_maximum:
+            raise ValueError(f"Simulation speed must be at least {Validate.simulation_speed_minimum} and at most {Validate.simulation_speed_maximum}!")
+
     @staticmethod
     def callback(callback):
         if not callable(callback):
@@ -0,0 +1,70 @@
+#imports
+from src.validate import Validate
+
+# the rules of when and how many enemies a level sends: a break before every wave,
+# then the enemies of the wave one by one, the next wave starts once all of them are gone
+# a schedule is only used by levels it is given to (i.e. the headless levels of balance sweeps),
+# levels without one never spawn enemies on their own
+class WaveSchedule():
+    #static variables
+    wave_break = 3000           #milliseconds before each wave starts
+    spawn_interval = 500        #milliseconds between two enemies of a wave
+    enemy_speed = 2.0           #cells per second
+    enemy_health = 10
+    difficulty_scaling = {
+        "Easy" : 0.75,
+        "Normal" : 1.0,
+        "Hard" : 1.25
+    }
+
+    def __init__(self, difficulty="Normal"):
+        self.set_difficulty(difficulty)
+        self.reset()
+
+    #VALIDATION METHOD:
+    @staticmethod
+    def validate_schedule(schedule):
+        if not isinstance(schedule, WaveSchedule):
+            raise TypeError("Wave schedule must be of class WaveSchedule or a subclass!")
+
+    #SETTERS, GETTERS AND OTHER CLASS METHODS:
+    #DIFFICULTY METHODS:
+    def set_difficulty(self, difficulty):
+        Validate.difficulty(difficulty)
+        self.__difficulty = difficulty
+
+    def get_difficulty(self):
+        return self.__difficulty
+
+    def get_difficulty_scaling(self):
+        return WaveSchedule.difficulty_scaling[self.__difficulty]
+
+    #WAVE METHODS:
+    # starts the break before the next wave
+    def reset(self):
+        self.__wave_timer = WaveSchedule.wave_break
+        self.__spawn_timer = 0
+        self.__spawned = 0
+
+    def get_wave_size(self, wave):
+        return round((4 + 2 * wave) * self.get_difficulty_scaling())
+
+    def get_enemy_health(self, wave):
+        return WaveSchedule.enemy_health * (1 + 0.25 * (wave - 1)) * self.get_difficulty_scaling()
+
+    #GAMELOOP METHODS:
+    def update(self, level, delta_time):
+        if self.__wave_timer > 0:
+            self.__wave_timer -= delta_time
+            return
+        wave = level.get_wave()
+        wave_size = self.get_wave_size(wave)
+        if self.__spawned < wave_size:
+            self.__spawn_timer -= delta_time
+            while self.__spawn_timer <= 0 and self.__spawned < wave_size:
+                level.spawn_enemy(WaveSchedule.enemy_speed, self.get_enemy_health(wave))
+                self.__spawned += 1
+                self.__spawn_timer += WaveSchedule.spawn_interval
+        elif level.get_enemies().get_count() == 0:
+            level.next_wave()
+            self.reset()